@@ -5,11 +5,13 @@ Handles job applications, cover letter generation, and tracking
 
 import os
 import json
+import hashlib
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import httpx
 from dataclasses import asdict
 import asyncio
+from collections import Counter
 
 class ApplicationService:
     """Manages job applications and AI-generated content"""
@@ -19,6 +21,17 @@ class ApplicationService:
         self.claude_api_key = os.getenv('ANTHROPIC_API_KEY')
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
+        
+        # Memoized kits keyed by (user, profile, job) hash; holds tasks so
+        # concurrent requests for the same kit share one generation
+        self._kit_cache: Dict[str, asyncio.Task] = {}
+        self._kit_cache_size = 128
+        
+        # Cap concurrent LLM calls to stay within the provider's rate limit; the
+        # daily run generates kits for several users and jobs at once
+        self.ai_max_concurrent_calls = int(os.getenv('AI_MAX_CONCURRENT_CALLS', '4'))
+        self._ai_semaphore: Optional[asyncio.Semaphore] = None
+        self._ai_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def generate_application_kit(
         self, 
@@ -29,8 +42,56 @@ class ApplicationService:
         """
         Generate complete application kit: resume, cover letter, LinkedIn message
         Uses user profile context to ensure ZERO fake data
+        
+        Kits are memoized per (user, profile context, job), so asking for the
+        same job twice - e.g. once for its resume, once for its cover letter -
+        only generates and stores it once.
         """
         
+        cache_key = self._kit_cache_key(user_id, job_data, profile_context)
+        
+        task = self._kit_cache.get(cache_key)
+        if task is None or task.cancelled():
+            task = asyncio.ensure_future(
+                self._build_application_kit(user_id, job_data, profile_context)
+            )
+            self._kit_cache[cache_key] = task
+            
+            # Evict the oldest entry once the cache is full
+            if len(self._kit_cache) > self._kit_cache_size:
+                self._kit_cache.pop(next(iter(self._kit_cache)))
+        
+        try:
+            # Shield the shared task so one cancelled caller doesn't cancel it for everyone
+            return await asyncio.shield(task)
+        except BaseException:
+            # Don't memoize failures or cancellations of the shared task
+            if task.done() and (task.cancelled() or task.exception() is not None):
+                if self._kit_cache.get(cache_key) is task:
+                    del self._kit_cache[cache_key]
+            raise
+    
+    def _kit_cache_key(self, user_id: str, job_data: Dict, profile_context: str) -> str:
+        """Hash the inputs that determine an application kit"""
+        
+        raw = '\x1f'.join([
+            user_id,
+            hashlib.sha256(profile_context.encode()).hexdigest(),
+            str(job_data.get('url', '')),
+            str(job_data.get('title', '')),
+            str(job_data.get('company', '')),
+            hashlib.sha256(str(job_data.get('description', '')).encode()).hexdigest()
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    async def _build_application_kit(
+        self,
+        user_id: str,
+        job_data: Dict,
+        profile_context: str
+    ) -> Dict:
+        """Generate and store an application kit (uncached)"""
+        
         # Generate all materials in parallel
         tasks = [
             self._generate_resume(profile_context, job_data),
@@ -154,14 +215,25 @@ Generate the LinkedIn message now:
         
         return await self._call_ai_api(prompt, max_tokens=150)
     
+    def _get_ai_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore shared by all AI calls on the running event loop"""
+        
+        loop = asyncio.get_running_loop()
+        if self._ai_semaphore is None or self._ai_semaphore_loop is not loop:
+            self._ai_semaphore = asyncio.Semaphore(self.ai_max_concurrent_calls)
+            self._ai_semaphore_loop = loop
+        return self._ai_semaphore
+    
     async def _call_ai_api(self, prompt: str, max_tokens: int = 500) -> str:
         """Call AI API (OpenAI or Claude) for content generation"""
         
         try:
             if self.openai_api_key:
-                return await self._call_openai(prompt, max_tokens)
+                async with self._get_ai_semaphore():
+                    return await self._call_openai(prompt, max_tokens)
             elif self.claude_api_key:
-                return await self._call_claude(prompt, max_tokens)
+                async with self._get_ai_semaphore():
+                    return await self._call_claude(prompt, max_tokens)
             else:
                 return "AI API key not configured"
         except Exception as e:
@@ -235,17 +307,18 @@ Generate the LinkedIn message now:
     async def track_application(self, application_data: Dict) -> Dict:
         """Track job application submission"""
         
+        now = datetime.now()
         application_record = {
             'user_id': application_data['user_id'],
             'job_url': application_data['job_url'],
             'job_title': application_data.get('job_title'),
             'company': application_data.get('company'),
-            'applied_date': datetime.now().isoformat(),
+            'applied_date': now.isoformat(),
             'application_method': application_data.get('application_method', 'company_website'),
             'status': 'applied',
             'notes': application_data.get('notes', ''),
             'materials_used': application_data.get('materials_used', []),
-            'follow_up_date': (datetime.now() + timedelta(days=7)).isoformat()
+            'follow_up_date': (now + timedelta(days=7)).isoformat()
         }
         
         async with httpx.AsyncClient() as client:
@@ -261,9 +334,10 @@ Generate the LinkedIn message now:
             )
             
             if response.status_code in [200, 201]:
+                created = response.json()  # Parse the inserted rows once
                 return {
                     'success': True,
-                    'application_id': response.json()[0]['id'] if response.json() else None,
+                    'application_id': created[0]['id'] if created else None,
                     'follow_up_date': application_record['follow_up_date']
                 }
             else:
@@ -380,42 +454,34 @@ Generate the LinkedIn message now:
                         'status_breakdown': {}
                     }
                 
-                # Calculate metrics
-                status_counts = {}
-                responses = 0
-                interviews = 0
-                response_times = []
+                # Status breakdown is counted in C; rates derive from it
+                status_counts = Counter(app.get('status', 'applied') for app in applications)
+                responses = total_applications - status_counts['applied']
+                interviews = status_counts['interview'] + status_counts['offer']
                 
+                # Running total for response time instead of collecting every value
+                response_days = 0
+                response_count = 0
                 for app in applications:
-                    status = app.get('status', 'applied')
-                    status_counts[status] = status_counts.get(status, 0) + 1
-                    
-                    if status != 'applied':
-                        responses += 1
-                    
-                    if status in ['interview', 'offer']:
-                        interviews += 1
-                    
-                    # Calculate response time if applicable
-                    if status != 'applied' and app.get('applied_date') and app.get('updated_at'):
+                    if app.get('status', 'applied') != 'applied' and app.get('applied_date') and app.get('updated_at'):
                         try:
                             applied = datetime.fromisoformat(app['applied_date'].replace('Z', '+00:00'))
                             updated = datetime.fromisoformat(app['updated_at'].replace('Z', '+00:00'))
-                            response_time = (updated - applied).days
-                            response_times.append(response_time)
+                            response_days += (updated - applied).days
+                            response_count += 1
                         except:
                             pass
                 
                 response_rate = (responses / total_applications) * 100
                 interview_rate = (interviews / total_applications) * 100
-                avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+                avg_response_time = response_days / response_count if response_count else 0
                 
                 return {
                     'total_applications': total_applications,
                     'response_rate': round(response_rate, 1),
                     'interview_rate': round(interview_rate, 1),
                     'avg_response_time': round(avg_response_time, 1),
-                    'status_breakdown': status_counts
+                    'status_breakdown': dict(status_counts)
                 }
         
         return {
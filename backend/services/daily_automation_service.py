@@ -12,6 +12,12 @@ import httpx
 import logging
 from dataclasses import asdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .job_service import JobService
 from .application_service import ApplicationService  
 from .profile_service import ProfileService
@@ -23,7 +29,6 @@ class DailyAutomationService:
     
     def __init__(self):
         # Initialize all service dependencies
-        self.job_service = JobService()
         self.application_service = ApplicationService()
         self.email_service = EmailService()
         self.learning_path_service = LearningPathService()
@@ -36,6 +41,17 @@ class DailyAutomationService:
         self.max_jobs_per_user = 20
         self.min_job_score = 60
         
+        # Automation stats change slowly; reuse them between polls (days -> (expires_at, stats))
+        self.stats_cache_ttl = 300
+        self._stats_cache = {}
+        
+        # Audit-log writes run in the background and are flushed at the end of a run
+        self._pending_writes = set()
+        
+        # Per-run {user_id: due} map of weekly learning-path refreshes, worked
+        # out once up front instead of queried per user
+        self._learning_path_due = {}
+        
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger('daily_automation')
@@ -58,12 +74,23 @@ class DailyAutomationService:
         # Process users in parallel (but limit concurrency)
         semaphore = asyncio.Semaphore(5)  # Max 5 concurrent users
         
-        tasks = [
-            self._process_user_daily(semaphore, user) 
-            for user in users if user
-        ]
+        self._learning_path_due = await self._get_learning_path_schedule(
+            [user['id'] for user in users if user]
+        )
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Each run gets its own JobService, so its pooled client is bound to this
+        # run's event loop and closing it can't cut off another run's requests
+        try:
+            async with JobService() as job_service:
+                tasks = [
+                    self._process_user_daily(semaphore, user, job_service) 
+                    for user in users if user
+                ]
+                
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                await self._flush_pending_writes()
+        finally:
+            self._learning_path_due = {}
         
         # Log results
         successful = sum(1 for r in results if r is not Exception and r.get('success', False))
@@ -78,7 +105,12 @@ class DailyAutomationService:
             'timestamp': datetime.now().isoformat()
         }
     
-    async def _process_user_daily(self, semaphore: asyncio.Semaphore, user: Dict) -> Dict:
+    async def _process_user_daily(
+        self,
+        semaphore: asyncio.Semaphore,
+        user: Dict,
+        job_service: JobService
+    ) -> Dict:
         """Process daily automation for a single user"""
         
         async with semaphore:
@@ -90,13 +122,20 @@ class DailyAutomationService:
                 self.logger.info(f"Processing user: {user_email}")
                 
                 # Step 1: Check if user has remaining searches
-                if not await self._can_user_search(user):
-                    self.logger.info(f"User {user_email} has no remaining searches")
-                    return {'success': False, 'reason': 'no_searches_remaining', 'user_id': user_id}
+                blocked_reason = self._get_search_block_reason(user)
+                if blocked_reason:
+                    self.logger.info(f"User {user_email} cannot search: {blocked_reason}")
+                    return {'success': False, 'reason': blocked_reason, 'user_id': user_id}
                 
-                # Step 2: Get comprehensive job search results
+                # Steps 2, 4 and 6a are independent reads: job search, the profile
+                # context for AI generation and the weekly learning-path check
                 self.logger.info(f"Searching jobs for {user_email}")
-                jobs = await self.job_service.get_daily_job_recommendations(user_id)
+                profile_service = ProfileService(user_id)
+                jobs, profile_context, update_learning_path = await asyncio.gather(
+                    job_service.get_daily_job_recommendations(user_id),
+                    profile_service.get_ai_context_string(),
+                    self._should_update_learning_path(user_id)
+                )
                 
                 if not jobs:
                     self.logger.info(f"No jobs found for {user_email}")
@@ -105,27 +144,26 @@ class DailyAutomationService:
                 # Step 3: Filter to top jobs
                 top_jobs = [job for job in jobs if job.score >= self.min_job_score][:self.max_jobs_per_user]
                 
-                # Step 4: Get user profile context for AI generation
-                profile_service = ProfileService(user_id)
-                profile_context = await profile_service.get_ai_context_string()
-                
                 # Step 5: Generate AI content for top jobs
                 self.logger.info(f"Generating AI content for {len(top_jobs)} jobs for {user_email}")
                 
-                # Generate tailored resume
+                # Generate tailored resume and cover letters for top 5 jobs concurrently
                 best_job = top_jobs[0] if top_jobs else jobs[0]
-                resume_content = await self._generate_tailored_resume(profile_context, best_job)
+                cover_letter_jobs = top_jobs[:5]
                 
-                # Generate cover letters for top 5 jobs
-                cover_letters = {}
-                for job in top_jobs[:5]:
-                    job_key = f"{job.company}_{job.title}".replace(' ', '_')
-                    cover_letter = await self._generate_cover_letter(profile_context, job)
-                    cover_letters[job_key] = cover_letter
+                resume_content, *letters = await asyncio.gather(
+                    self._generate_tailored_resume(profile_context, best_job),
+                    *(self._generate_cover_letter(profile_context, job) for job in cover_letter_jobs)
+                )
+                
+                cover_letters = {
+                    f"{job.company}_{job.title}".replace(' ', '_'): cover_letter
+                    for job, cover_letter in zip(cover_letter_jobs, letters)
+                }
                 
                 # Step 6: Generate learning path (weekly refresh)
                 learning_path_content = ""
-                if await self._should_update_learning_path(user_id):
+                if update_learning_path:
                     self.logger.info(f"Generating learning path for {user_email}")
                     learning_path_content = await self.learning_path_service.generate_learning_path_document(user_id)
                 
@@ -146,17 +184,17 @@ class DailyAutomationService:
                 
                 if email_sent:
                     # Step 8: Update user's search count
-                    await self._decrement_user_searches(user_id)
+                    await self._decrement_user_searches(user_id, user.get('searches_remaining', 0))
                     
-                    # Step 9: Log automation success
-                    await self._log_automation_run(user_id, {
+                    # Step 9: Log automation success (off the per-user critical path)
+                    self._fire_and_forget(self._log_automation_run(user_id, {
                         'jobs_found': len(jobs),
                         'jobs_sent': len(top_jobs),
                         'resume_generated': bool(resume_content),
                         'cover_letters_generated': len(cover_letters),
                         'learning_path_updated': bool(learning_path_content),
                         'email_sent': True
-                    })
+                    }))
                     
                     self.logger.info(f"Successfully processed {user_email}")
                     return {'success': True, 'user_id': user_id, 'jobs_sent': len(top_jobs)}
@@ -179,7 +217,9 @@ class DailyAutomationService:
             return {'success': False, 'reason': 'user_not_found'}
         
         semaphore = asyncio.Semaphore(1)
-        result = await self._process_user_daily(semaphore, user)
+        async with JobService() as job_service:
+            result = await self._process_user_daily(semaphore, user, job_service)
+            await self._flush_pending_writes()
         
         return result
     
@@ -210,6 +250,24 @@ class DailyAutomationService:
         
         return kit.get('cover_letter', '')
     
+    def _fire_and_forget(self, coro) -> None:
+        """Run a write in the background without waiting for the response"""
+        
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+    
+    async def _flush_pending_writes(self) -> None:
+        """Wait for outstanding background writes, logging any that failed"""
+        
+        if not self._pending_writes:
+            return
+        
+        results = await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Background write failed: {result}")
+    
     def _job_result_to_dict(self, job: 'JobResult') -> Dict:
         """Convert JobResult dataclass to dictionary"""
         
@@ -279,18 +337,18 @@ class DailyAutomationService:
             
             return None
     
-    async def _can_user_search(self, user: Dict) -> bool:
-        """Check if user can perform job searches"""
+    def _get_search_block_reason(self, user: Dict) -> Optional[str]:
+        """Return why a user can't perform job searches, or None if they can"""
         
         # Check remaining searches
         searches_remaining = user.get('searches_remaining', 0)
         if searches_remaining <= 0:
-            return False
+            return 'no_searches_remaining'
         
         # Check subscription status
         subscription_status = user.get('subscription_status', 'expired')
         if subscription_status not in ['trial', 'active']:
-            return False
+            return 'subscription_inactive'
         
         # Check if trial expired
         if subscription_status == 'trial':
@@ -299,15 +357,19 @@ class DailyAutomationService:
                 try:
                     trial_end_date = datetime.fromisoformat(trial_end.replace('Z', '+00:00'))
                     if trial_end_date < datetime.now(trial_end_date.tzinfo):
-                        return False
-                except:
+                        return 'trial_expired'
+                except (AttributeError, TypeError, ValueError):
                     pass
         
-        return True
+        return None
     
     async def _should_update_learning_path(self, user_id: str) -> bool:
         """Check if learning path should be updated (weekly refresh)"""
         
+        due = self._learning_path_due.get(user_id)
+        if due is not None:
+            return due
+        
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 f"{self.supabase_url}/rest/v1/learning_paths",
@@ -325,36 +387,78 @@ class DailyAutomationService:
             if response.status_code == 200:
                 paths = response.json()
                 if paths:
-                    last_generated = paths[0]['generated_date']
-                    try:
-                        last_date = datetime.fromisoformat(last_generated.replace('Z', '+00:00'))
-                        days_since = (datetime.now(last_date.tzinfo) - last_date).days
-                        return days_since >= 7  # Update weekly
-                    except:
-                        return True
+                    return self._is_learning_path_stale(paths[0]['generated_date'])
                 
         return True  # No previous path, generate new one
     
-    async def _decrement_user_searches(self, user_id: str):
-        """Decrement user's remaining searches"""
+    async def _get_learning_path_schedule(self, user_ids: List[str]) -> Dict[str, bool]:
+        """Work out which users are due a learning path refresh in a few batched queries"""
+        
+        if not user_ids:
+            return {}
+        
+        # Only paths from the last week matter, which keeps the result to about
+        # one row per user; batching keeps each URL and response under the row cap
+        since = (datetime.now() - timedelta(days=7)).isoformat()
+        batch_size = 100
+        
+        # Users without a recent path get a new one
+        due = dict.fromkeys(user_ids, True)
         
         async with httpx.AsyncClient() as client:
-            # Get current count first
-            user = await self._get_user_by_id(user_id)
-            if user:
-                current_searches = user.get('searches_remaining', 0)
-                new_count = max(0, current_searches - 1)
-                
-                await client.patch(
-                    f"{self.supabase_url}/rest/v1/profiles",
-                    params={"id": f"eq.{user_id}"},
-                    json={"searches_remaining": new_count},
+            for start in range(0, len(user_ids), batch_size):
+                batch = user_ids[start:start + batch_size]
+                response = await client.get(
+                    f"{self.supabase_url}/rest/v1/learning_paths",
+                    params={
+                        "user_id": f"in.({','.join(batch)})",
+                        "generated_date": f"gte.{since}",
+                        "select": "user_id,generated_date"
+                    },
                     headers={
                         "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json"
+                        "Authorization": f"Bearer {self.supabase_key}"
                     }
                 )
+                
+                if response.status_code != 200:
+                    return {}  # Fall back to per-user checks
+                
+                for path in response.json():
+                    user_id = path.get('user_id')
+                    if due.get(user_id) and not self._is_learning_path_stale(path.get('generated_date')):
+                        due[user_id] = False
+        
+        return due
+    
+    def _is_learning_path_stale(self, last_generated: str) -> bool:
+        """True when the last learning path is at least a week old"""
+        
+        try:
+            last_date = datetime.fromisoformat(last_generated.replace('Z', '+00:00'))
+            days_since = (datetime.now(last_date.tzinfo) - last_date).days
+            return days_since >= 7  # Update weekly
+        except (AttributeError, TypeError, ValueError):
+            return True
+    
+    async def _decrement_user_searches(self, user_id: str, current_searches: int):
+        """Decrement user's remaining searches (current_searches: count the caller already holds)"""
+        
+        new_count = max(0, current_searches - 1)
+        if new_count == current_searches:
+            return  # Already at zero, nothing to write
+        
+        async with httpx.AsyncClient() as client:
+            await client.patch(
+                f"{self.supabase_url}/rest/v1/profiles",
+                params={"id": f"eq.{user_id}"},
+                json={"searches_remaining": new_count},
+                headers={
+                    "apikey": self.supabase_key,
+                    "Authorization": f"Bearer {self.supabase_key}",
+                    "Content-Type": "application/json"
+                }
+            )
     
     async def _log_automation_run(self, user_id: str, stats: Dict):
         """Log automation run statistics"""
@@ -371,10 +475,13 @@ class DailyAutomationService:
             'success': True
         }
         
+        # orjson encodes straight to bytes; otherwise let httpx use stdlib json
+        body = {'content': orjson.dumps(log_data)} if ORJSON_AVAILABLE else {'json': log_data}
+        
         async with httpx.AsyncClient() as client:
             await client.post(
                 f"{self.supabase_url}/rest/v1/automation_logs",
-                json=log_data,
+                **body,
                 headers={
                     "apikey": self.supabase_key,
                     "Authorization": f"Bearer {self.supabase_key}",
@@ -387,6 +494,10 @@ class DailyAutomationService:
     async def get_automation_stats(self, days: int = 30) -> Dict:
         """Get automation statistics for the last N days"""
         
+        cached = self._stats_cache.get(days)
+        if cached and cached[0] > datetime.now():
+            return cached[1]
+        
         start_date = datetime.now() - timedelta(days=days)
         
         async with httpx.AsyncClient() as client:
@@ -394,7 +505,8 @@ class DailyAutomationService:
                 f"{self.supabase_url}/rest/v1/automation_logs",
                 params={
                     "run_date": f"gte.{start_date.isoformat()}",
-                    "select": "*"
+                    # Only the columns the aggregates read, not every logged field
+                    "select": "user_id,success,email_sent,jobs_found,jobs_sent"
                 },
                 headers={
                     "apikey": self.supabase_key,
@@ -405,13 +517,24 @@ class DailyAutomationService:
             if response.status_code == 200:
                 logs = response.json()
                 
+                # Single pass over the logs for all aggregates
                 total_runs = len(logs)
-                successful_runs = len([l for l in logs if l.get('success')])
-                total_jobs_found = sum(l.get('jobs_found', 0) for l in logs)
-                total_jobs_sent = sum(l.get('jobs_sent', 0) for l in logs)
-                emails_sent = len([l for l in logs if l.get('email_sent')])
+                successful_runs = 0
+                total_jobs_found = 0
+                total_jobs_sent = 0
+                emails_sent = 0
+                active_users = set()
+                
+                for log in logs:
+                    if log.get('success'):
+                        successful_runs += 1
+                    if log.get('email_sent'):
+                        emails_sent += 1
+                    total_jobs_found += log.get('jobs_found', 0)
+                    total_jobs_sent += log.get('jobs_sent', 0)
+                    active_users.add(log.get('user_id'))
                 
-                return {
+                stats = {
                     'period_days': days,
                     'total_runs': total_runs,
                     'successful_runs': successful_runs,
@@ -420,8 +543,10 @@ class DailyAutomationService:
                     'total_jobs_sent': total_jobs_sent,
                     'emails_sent': emails_sent,
                     'avg_jobs_per_run': total_jobs_sent / successful_runs if successful_runs > 0 else 0,
-                    'active_users': len(set(l.get('user_id') for l in logs))
+                    'active_users': len(active_users)
                 }
+                self._stats_cache[days] = (datetime.now() + timedelta(seconds=self.stats_cache_ttl), stats)
+                return stats
         
         return {
             'period_days': days,
@@ -38,6 +38,16 @@ class EmailService:
         # Supabase for database operations
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
+        
+        # Pick the delivery backend once: Resend (preferred), SendGrid, then SMTP
+        if self.resend_api_key:
+            self._deliver = self._send_via_resend
+        elif self.sendgrid_api_key:
+            self._deliver = self._send_via_sendgrid
+        elif self.smtp_username and self.smtp_password:
+            self._deliver = self._send_via_smtp
+        else:
+            self._deliver = None
     
     async def send_daily_jobs_email(
         self, 
@@ -66,10 +76,13 @@ class EmailService:
         # Generate CSV attachment
         jobs_csv = self._generate_jobs_csv(jobs)
         
+        # One date stamp for every attachment name
+        date_stamp = datetime.now().strftime("%Y%m%d")
+        
         # Prepare attachments
         attachments = [
             {
-                'filename': f'jobs_{datetime.now().strftime("%Y%m%d")}.csv',
+                'filename': f'jobs_{date_stamp}.csv',
                 'content': jobs_csv,
                 'content_type': 'text/csv'
             }
@@ -78,7 +91,7 @@ class EmailService:
         # Add resume attachment if provided
         if resume_content:
             attachments.append({
-                'filename': f'resume_{datetime.now().strftime("%Y%m%d")}.txt',
+                'filename': f'resume_{date_stamp}.txt',
                 'content': resume_content,
                 'content_type': 'text/plain'
             })
@@ -86,7 +99,7 @@ class EmailService:
         # Add learning path attachment if provided
         if learning_path:
             attachments.append({
-                'filename': f'learning_path_{datetime.now().strftime("%Y%m%d")}.md',
+                'filename': f'learning_path_{date_stamp}.md',
                 'content': learning_path,
                 'content_type': 'text/markdown'
             })
@@ -421,9 +434,9 @@ class EmailService:
         ]
         writer.writerow(headers)
         
-        # Job data
-        for job in jobs:
-            writer.writerow([
+        # Job data - one writerows call over a row generator
+        writer.writerows(
+            [
                 job.get('title', ''),
                 job.get('company', ''),
                 job.get('location', ''),
@@ -436,7 +449,9 @@ class EmailService:
                 job.get('source', ''),
                 job.get('url', ''),
                 job.get('description', '')[:500]  # Truncate description
-            ])
+            ]
+            for job in jobs
+        )
         
         return output.getvalue()
     
@@ -447,23 +462,13 @@ class EmailService:
         html_content: str,
         attachments: Optional[List[Dict]] = None
     ) -> bool:
-        """Send email using available service"""
-        
-        # Try Resend first (preferred)
-        if self.resend_api_key:
-            return await self._send_via_resend(to_email, subject, html_content, attachments)
+        """Send email using the backend selected at startup"""
         
-        # Try SendGrid
-        elif self.sendgrid_api_key:
-            return await self._send_via_sendgrid(to_email, subject, html_content, attachments)
-        
-        # Fallback to SMTP
-        elif self.smtp_username and self.smtp_password:
-            return await self._send_via_smtp(to_email, subject, html_content, attachments)
-        
-        else:
+        if self._deliver is None:
             print("No email service configured")
             return False
+        
+        return await self._deliver(to_email, subject, html_content, attachments)
     
     async def _send_via_resend(
         self, 
@@ -553,14 +558,20 @@ class EmailService:
                     )
                     message.attach(part)
             
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.sendmail(self.from_email, to_email, message.as_string())
+            # smtplib blocks on the network; run it in a worker thread so the
+            # event loop keeps serving other users' pipelines meanwhile
+            await asyncio.to_thread(self._smtp_sendmail, to_email, message.as_string())
             
             return True
         
         except Exception as e:
             print(f"SMTP email error: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _smtp_sendmail(self, to_email: str, message: str) -> None:
+        """Blocking SMTP delivery (called off the event loop)"""
+        
+        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            server.starttls()
+            server.login(self.smtp_username, self.smtp_password)
+            server.sendmail(self.from_email, to_email, message)
\ No newline at end of file
@@ -4,13 +4,33 @@ Enhanced job search with multiple sources and comprehensive filtering
 """
 
 import os
+import sys
+import heapq
+import operator
 import asyncio
 import httpx
 import json
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 import re
+from itertools import islice
+
+# Shared Adzuna rate limiter lives with the core search services
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'core', 'services'))
+
+from rate_limiter import adzuna_limiter
+
+# Optional: count all high-value keywords in one pass over a job's text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Title seniority patterns (plain alternations, same matches as substring checks)
+_SENIOR_TITLE_RE = re.compile(r'senior|lead|principal')
+_JUNIOR_TITLE_RE = re.compile(r'junior|entry|intern|new grad')
 
 @dataclass
 class JobResult:
@@ -67,6 +87,37 @@ class JobService:
             "new grad", "recent graduate", "visa sponsorship",
             "tennis", "sports tech", "fintech", "edtech"
         ]
+        self._keyword_automaton = self._build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+        
+        # Adzuna timeouts: fail fast on connect, cap the whole term at 10s
+        self.adzuna_timeout = httpx.Timeout(8.0, connect=3.0)
+        self.adzuna_term_timeout = 10
+        
+        # Shared HTTP client (created lazily, reused across searches and DB calls)
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive client, creating it on first use"""
+        
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+            )
+        return self.client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
     
     async def comprehensive_job_search(
         self, 
@@ -121,13 +172,13 @@ class JobService:
         # Score jobs based on relevance
         scored_jobs = self._score_jobs(unique_jobs, search_params)
         
-        # Sort by score (highest first)
-        scored_jobs.sort(key=lambda x: x.score, reverse=True)
+        # Keep only the top 100 by score (highest first) - no need to sort everything
+        top_jobs = heapq.nlargest(100, scored_jobs, key=operator.attrgetter('score'))
         
         # Store results in database
-        await self._store_job_results(user_id, scored_jobs[:100])  # Store top 100
+        await self._store_job_results(user_id, top_jobs)  # Store top 100
         
-        return scored_jobs[:50]  # Return top 50
+        return top_jobs[:50]  # Return top 50
     
     async def get_daily_job_recommendations(self, user_id: str) -> List[JobResult]:
         """
@@ -161,48 +212,87 @@ class JobService:
         jobs = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                for term in self.search_terms[:5]:  # Limit API calls
-                    url = f"https://api.adzuna.com/v1/api/jobs/us/search/1"
-                    
-                    query_params = {
-                        'app_id': self.adzuna_app_id,
-                        'app_key': self.adzuna_api_key,
-                        'what': term,
-                        'where': params.get('location', 'United States'),
-                        'results_per_page': params.get('max_results_per_source', 50),
-                        'salary_min': params.get('min_salary', 40000),
-                        'sort_by': 'date'
-                    }
-                    
-                    response = await client.get(url, params=query_params, timeout=30)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        for job in data.get('results', []):
-                            jobs.append(JobResult(
-                                title=job.get('title', ''),
-                                company=job.get('company', {}).get('display_name', ''),
-                                location=job.get('location', {}).get('display_name', ''),
-                                description=job.get('description', ''),
-                                url=job.get('redirect_url', ''),
-                                salary_min=job.get('salary_min'),
-                                salary_max=job.get('salary_max'),
-                                job_type=self._extract_job_type(job.get('contract_type', '')),
-                                remote=self._is_remote_job(job.get('description', '') + ' ' + job.get('location', {}).get('display_name', '')),
-                                posted_date=job.get('created', ''),
-                                source='adzuna'
-                            ))
-                    
-                    # Rate limiting
-                    await asyncio.sleep(0.5)
+            client = self._get_client()
+            terms = self.search_terms[:5]  # Limit API calls
+            results = await asyncio.gather(*[
+                self._search_adzuna_term_limited(client, term, params)
+                for term in terms
+            ], return_exceptions=True)
+            
+            for term, result in zip(terms, results):
+                if isinstance(result, list):
+                    jobs.extend(result)
+                elif isinstance(result, asyncio.TimeoutError):
+                    print(f"Adzuna search timed out for '{term}'")
+                elif isinstance(result, Exception):
+                    print(f"Adzuna search error: {result}")
         
         except Exception as e:
             print(f"Adzuna search error: {e}")
         
         return jobs
     
+    async def _search_adzuna_term_limited(
+        self,
+        client: httpx.AsyncClient,
+        term: str,
+        params: Dict
+    ) -> List[JobResult]:
+        """Search one term once the shared Adzuna rate limiter allows it"""
+        
+        # Process-wide token bucket keeps concurrent users under Adzuna's ~5 req/s;
+        # the timeout starts after the wait so queueing doesn't count against it
+        await adzuna_limiter.acquire()
+        
+        # Bound each term so one hung response can't stall the batch
+        return await asyncio.wait_for(
+            self._search_adzuna_term(client, term, params),
+            timeout=self.adzuna_term_timeout
+        )
+    
+    async def _search_adzuna_term(
+        self,
+        client: httpx.AsyncClient,
+        term: str,
+        params: Dict
+    ) -> List[JobResult]:
+        """Search Adzuna for a single term"""
+        
+        jobs = []
+        url = f"https://api.adzuna.com/v1/api/jobs/us/search/1"
+        
+        query_params = {
+            'app_id': self.adzuna_app_id,
+            'app_key': self.adzuna_api_key,
+            'what': term,
+            'where': params.get('location', 'United States'),
+            'results_per_page': params.get('max_results_per_source', 50),
+            'salary_min': params.get('min_salary', 40000),
+            'sort_by': 'date'
+        }
+        
+        response = await client.get(url, params=query_params, timeout=self.adzuna_timeout)
+        
+        if response.status_code == 200:
+            data = response.json()
+            
+            for job in data.get('results', []):
+                jobs.append(JobResult(
+                    title=job.get('title', ''),
+                    company=job.get('company', {}).get('display_name', ''),
+                    location=job.get('location', {}).get('display_name', ''),
+                    description=job.get('description', ''),
+                    url=job.get('redirect_url', ''),
+                    salary_min=job.get('salary_min'),
+                    salary_max=job.get('salary_max'),
+                    job_type=self._extract_job_type(job.get('contract_type', '')),
+                    remote=self._is_remote_job(job.get('description', '') + ' ' + job.get('location', {}).get('display_name', '')),
+                    posted_date=job.get('created', ''),
+                    source='adzuna'
+                ))
+        
+        return jobs
+    
     async def _search_indeed(self, params: Dict) -> List[JobResult]:
         """Search Indeed API (if available)"""
         
@@ -230,35 +320,35 @@ class JobService:
         jobs = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                for term in self.search_terms[:3]:
-                    url = f"https://jobs.github.com/positions.json"
-                    
-                    query_params = {
-                        'description': term,
-                        'location': params.get('location', ''),
-                        'full_time': 'true' if 'full-time' in params.get('job_types', []) else 'false'
-                    }
-                    
-                    response = await client.get(url, params=query_params, timeout=20)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        for job in data:
-                            jobs.append(JobResult(
-                                title=job.get('title', ''),
-                                company=job.get('company', ''),
-                                location=job.get('location', ''),
-                                description=job.get('description', ''),
-                                url=job.get('url', ''),
-                                job_type=job.get('type', 'Full Time'),
-                                remote=self._is_remote_job(job.get('location', '')),
-                                posted_date=job.get('created_at', ''),
-                                source='github'
-                            ))
+            client = self._get_client()
+            for term in self.search_terms[:3]:
+                url = f"https://jobs.github.com/positions.json"
+                
+                query_params = {
+                    'description': term,
+                    'location': params.get('location', ''),
+                    'full_time': 'true' if 'full-time' in params.get('job_types', []) else 'false'
+                }
+                
+                response = await client.get(url, params=query_params, timeout=20)
+                
+                if response.status_code == 200:
+                    data = response.json()
                     
-                    await asyncio.sleep(0.3)
+                    for job in data:
+                        jobs.append(JobResult(
+                            title=job.get('title', ''),
+                            company=job.get('company', ''),
+                            location=job.get('location', ''),
+                            description=job.get('description', ''),
+                            url=job.get('url', ''),
+                            job_type=job.get('type', 'Full Time'),
+                            remote=self._is_remote_job(job.get('location', '')),
+                            posted_date=job.get('created_at', ''),
+                            source='github'
+                        ))
+                
+                await asyncio.sleep(0.3)
         
         except Exception as e:
             print(f"GitHub Jobs search error: {e}")
@@ -271,45 +361,45 @@ class JobService:
         jobs = []
         
         try:
-            async with httpx.AsyncClient() as client:
-                url = "https://stackoverflow.com/jobs/feed"
-                
-                response = await client.get(url, timeout=20)
+            client = self._get_client()
+            url = "https://stackoverflow.com/jobs/feed"
+            
+            response = await client.get(url, timeout=20)
+            
+            if response.status_code == 200:
+                # Parse RSS feed (simplified)
+                content = response.text
                 
-                if response.status_code == 200:
-                    # Parse RSS feed (simplified)
-                    content = response.text
+                # Basic RSS parsing for job titles and links
+                import xml.etree.ElementTree as ET
+                try:
+                    root = ET.fromstring(content)
                     
-                    # Basic RSS parsing for job titles and links
-                    import xml.etree.ElementTree as ET
-                    try:
-                        root = ET.fromstring(content)
+                    for item in root.findall('.//item')[:20]:
+                        title = item.find('title')
+                        link = item.find('link')
+                        description = item.find('description')
+                        pub_date = item.find('pubDate')
                         
-                        for item in root.findall('.//item')[:20]:
-                            title = item.find('title')
-                            link = item.find('link')
-                            description = item.find('description')
-                            pub_date = item.find('pubDate')
+                        if title is not None and link is not None:
+                            # Extract company from title (format: "Job Title at Company")
+                            title_text = title.text or ''
+                            company_match = re.search(r' at (.+?)(?:\s*\(|$)', title_text)
+                            company = company_match.group(1) if company_match else 'Company Not Listed'
                             
-                            if title is not None and link is not None:
-                                # Extract company from title (format: "Job Title at Company")
-                                title_text = title.text or ''
-                                company_match = re.search(r' at (.+?)(?:\s*\(|$)', title_text)
-                                company = company_match.group(1) if company_match else 'Company Not Listed'
-                                
-                                jobs.append(JobResult(
-                                    title=title_text,
-                                    company=company,
-                                    location='Remote/Various',
-                                    description=description.text[:500] if description is not None else '',
-                                    url=link.text or '',
-                                    remote=True,
-                                    posted_date=pub_date.text if pub_date is not None else '',
-                                    source='stackoverflow'
-                                ))
-                    
-                    except ET.ParseError:
-                        print("Could not parse Stack Overflow RSS feed")
+                            jobs.append(JobResult(
+                                title=title_text,
+                                company=company,
+                                location='Remote/Various',
+                                description=description.text[:500] if description is not None else '',
+                                url=link.text or '',
+                                remote=True,
+                                posted_date=pub_date.text if pub_date is not None else '',
+                                source='stackoverflow'
+                            ))
+                
+                except ET.ParseError:
+                    print("Could not parse Stack Overflow RSS feed")
         
         except Exception as e:
             print(f"Stack Overflow Jobs search error: {e}")
@@ -338,36 +428,44 @@ class JobService:
     def _score_jobs(self, jobs: List[JobResult], search_params: Dict) -> List[JobResult]:
         """Score jobs based on relevance and desirability"""
         
+        # Per-batch constants, resolved once rather than per job
+        min_salary = search_params.get('min_salary', 40000)
+        remote_ok = search_params.get('remote_ok', True)
+        now = datetime.now(timezone.utc)
+        
         for job in jobs:
             score = 50  # Base score
             
             # Score based on title relevance
             title_lower = job.title.lower()
-            if any(term in title_lower for term in ['senior', 'lead', 'principal']):
+            if _SENIOR_TITLE_RE.search(title_lower):
                 score -= 20  # Too senior
-            elif any(term in title_lower for term in ['junior', 'entry', 'intern', 'new grad']):
+            elif _JUNIOR_TITLE_RE.search(title_lower):
                 score += 20  # Perfect level
             
             # Score based on company and description keywords
             content = (job.title + ' ' + job.company + ' ' + job.description).lower()
-            
-            for keyword in self.high_value_keywords:
-                if keyword in content:
-                    score += 5
+            if self._keyword_automaton is not None:
+                keyword_hits = len({keyword for _, keyword in self._keyword_automaton.iter(content)})
+            else:
+                keyword_hits = sum(1 for keyword in self.high_value_keywords if keyword in content)
+            score += 5 * keyword_hits
             
             # Salary bonus
-            if job.salary_min and job.salary_min >= search_params.get('min_salary', 40000):
+            if job.salary_min and job.salary_min >= min_salary:
                 score += 10
             
             # Remote work bonus
-            if job.remote and search_params.get('remote_ok', True):
+            if job.remote and remote_ok:
                 score += 15
             
             # Recent posting bonus
             if job.posted_date:
                 try:
                     posted = datetime.fromisoformat(job.posted_date.replace('Z', '+00:00'))
-                    days_old = (datetime.now(posted.tzinfo) - posted).days
+                    if posted.tzinfo is None:
+                        posted = posted.replace(tzinfo=timezone.utc)
+                    days_old = (now - posted).days
                     if days_old <= 7:
                         score += 10
                     elif days_old <= 30:
@@ -383,6 +481,15 @@ class JobService:
         
         return jobs
     
+    def _build_keyword_automaton(self):
+        """Aho-Corasick automaton over high_value_keywords (overlapping matches included)"""
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self.high_value_keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
     def _extract_job_type(self, contract_type: str) -> str:
         """Extract standardized job type"""
         
@@ -413,20 +520,20 @@ class JobService:
     async def _get_user_preferences(self, user_id: str) -> Dict:
         """Get user job search preferences"""
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.supabase_url}/rest/v1/profile_data",
-                params={"user_id": f"eq.{user_id}"},
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    return data[0].get('job_preferences', {})
+        client = self._get_client()
+        response = await client.get(
+            f"{self.supabase_url}/rest/v1/profile_data",
+            params={"user_id": f"eq.{user_id}"},
+            headers={
+                "apikey": self.supabase_key,
+                "Authorization": f"Bearer {self.supabase_key}"
+            }
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if data:
+                return data[0].get('job_preferences', {})
         
         # Default preferences
         return {
@@ -440,30 +547,31 @@ class JobService:
     async def _get_applied_job_urls(self, user_id: str) -> set:
         """Get URLs of jobs user has already applied to"""
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.supabase_url}/rest/v1/applications",
-                params={"user_id": f"eq.{user_id}"},
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {app.get('job_url', '') for app in data}
+        client = self._get_client()
+        response = await client.get(
+            f"{self.supabase_url}/rest/v1/applications",
+            # Only the URL column is needed to build the lookup set
+            params={"user_id": f"eq.{user_id}", "select": "job_url"},
+            headers={
+                "apikey": self.supabase_key,
+                "Authorization": f"Bearer {self.supabase_key}"
+            }
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            return {app.get('job_url', '') for app in data}
         
         return set()
     
     async def _store_job_results(self, user_id: str, jobs: List[JobResult]):
         """Store job search results in database"""
         
-        job_records = []
         current_time = datetime.now().isoformat()
         
-        for job in jobs:
-            job_records.append({
+        # Build records lazily so only one batch is materialized at a time
+        job_records = (
+            {
                 'user_id': user_id,
                 'title': job.title,
                 'company': job.company,
@@ -478,24 +586,28 @@ class JobService:
                 'source': job.source,
                 'score': job.score,
                 'found_at': current_time
-            })
+            }
+            for job in jobs
+        )
         
         # Store in batches
         batch_size = 50
-        for i in range(0, len(job_records), batch_size):
-            batch = job_records[i:i + batch_size]
+        client = self._get_client()
+        while True:
+            batch = list(islice(job_records, batch_size))
+            if not batch:
+                break
             
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    f"{self.supabase_url}/rest/v1/jobs",
-                    json=batch,
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json"
-                    },
-                    timeout=30
-                )
+            await client.post(
+                f"{self.supabase_url}/rest/v1/jobs",
+                json=batch,
+                headers={
+                    "apikey": self.supabase_key,
+                    "Authorization": f"Bearer {self.supabase_key}",
+                    "Content-Type": "application/json"
+                },
+                timeout=30
+            )
     
     async def get_jobs_mobile(
         self, 
@@ -508,57 +620,57 @@ class JobService:
         
         offset = (page - 1) * limit
         
-        async with httpx.AsyncClient() as client:
-            params = {
-                "user_id": f"eq.{user_id}",
-                "limit": str(limit),
-                "offset": str(offset),
-                "order": "score.desc,found_at.desc"
+        client = self._get_client()
+        params = {
+            "user_id": f"eq.{user_id}",
+            "limit": str(limit),
+            "offset": str(offset),
+            "order": "score.desc,found_at.desc"
+        }
+        
+        # Add filters if provided
+        if filters:
+            for key, value in filters.items():
+                params[key] = f"eq.{value}"
+        
+        response = await client.get(
+            f"{self.supabase_url}/rest/v1/jobs",
+            params=params,
+            headers={
+                "apikey": self.supabase_key,
+                "Authorization": f"Bearer {self.supabase_key}"
             }
-            
-            # Add filters if provided
-            if filters:
-                for key, value in filters.items():
-                    params[key] = f"eq.{value}"
-            
-            response = await client.get(
-                f"{self.supabase_url}/rest/v1/jobs",
-                params=params,
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
-            )
-            
-            if response.status_code == 200:
-                return response.json()
+        )
+        
+        if response.status_code == 200:
+            return response.json()
         
         return []
     
     async def count_jobs(self, user_id: str, filters: Optional[Dict] = None) -> int:
         """Count total jobs for pagination"""
         
-        async with httpx.AsyncClient() as client:
-            params = {
-                "user_id": f"eq.{user_id}",
-                "select": "count"
+        client = self._get_client()
+        params = {
+            "user_id": f"eq.{user_id}",
+            "select": "count"
+        }
+        
+        if filters:
+            for key, value in filters.items():
+                params[key] = f"eq.{value}"
+        
+        response = await client.get(
+            f"{self.supabase_url}/rest/v1/jobs",
+            params=params,
+            headers={
+                "apikey": self.supabase_key,
+                "Authorization": f"Bearer {self.supabase_key}"
             }
-            
-            if filters:
-                for key, value in filters.items():
-                    params[key] = f"eq.{value}"
-            
-            response = await client.get(
-                f"{self.supabase_url}/rest/v1/jobs",
-                params=params,
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data[0].get('count', 0) if data else 0
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            return data[0].get('count', 0) if data else 0
         
         return 0
\ No newline at end of file
@@ -6,6 +6,7 @@ Creates personalized learning paths based on job requirements and skill gaps
 import os
 import json
 import asyncio
+import heapq
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 import httpx
@@ -274,25 +275,24 @@ Based on recent job analysis:
     async def _get_user_profile(self, user_id: str) -> Dict:
         """Get user profile and current skills"""
         
+        headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}"
+        }
+        
         async with httpx.AsyncClient() as client:
-            # Get basic profile
-            profile_response = await client.get(
-                f"{self.supabase_url}/rest/v1/profiles",
-                params={"id": f"eq.{user_id}"},
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
-            )
-            
-            # Get detailed profile data
-            profile_data_response = await client.get(
-                f"{self.supabase_url}/rest/v1/profile_data",
-                params={"user_id": f"eq.{user_id}"},
-                headers={
-                    "apikey": self.supabase_key,
-                    "Authorization": f"Bearer {self.supabase_key}"
-                }
+            # Basic profile and detailed profile data in one round of requests
+            profile_response, profile_data_response = await asyncio.gather(
+                client.get(
+                    f"{self.supabase_url}/rest/v1/profiles",
+                    params={"id": f"eq.{user_id}"},
+                    headers=headers
+                ),
+                client.get(
+                    f"{self.supabase_url}/rest/v1/profile_data",
+                    params={"user_id": f"eq.{user_id}"},
+                    headers=headers
+                )
             )
             
             profile = {}
@@ -314,7 +314,6 @@ Based on recent job analysis:
         jobs = await self._get_recent_jobs(user_id)
         
         # Extract skills from job descriptions
-        all_skills = []
         skill_frequency = Counter()
         salary_data = []
         
@@ -322,12 +321,8 @@ Based on recent job analysis:
             description = job.get('description', '').lower()
             title = job.get('title', '').lower()
             
-            # Extract skills from description and title
-            extracted_skills = self._extract_skills_from_text(description + ' ' + title)
-            all_skills.extend(extracted_skills)
-            
-            for skill in extracted_skills:
-                skill_frequency[skill] += 1
+            # Extract skills from description and title; Counter.update counts in C
+            skill_frequency.update(self._extract_skills_from_text(description + ' ' + title))
             
             # Collect salary data
             if job.get('salary_min'):
@@ -375,10 +370,10 @@ Based on recent job analysis:
                 
                 skill_gaps.append(skill_gap)
         
-        # Sort by importance (frequency * gap size)
-        skill_gaps.sort(key=lambda x: x.importance * (x.required_level - x.current_level), reverse=True)
-        
-        return skill_gaps[:15]  # Return top 15 skill gaps
+        # Top 15 skill gaps by importance (frequency * gap size); partial selection, no full sort
+        return heapq.nlargest(
+            15, skill_gaps, key=lambda x: x.importance * (x.required_level - x.current_level)
+        )
     
     async def _recommend_projects(self, skill_gaps: List[SkillGap], user_profile: Dict) -> List[Dict]:
         """Recommend projects based on skill gaps"""
@@ -412,10 +407,8 @@ Based on recent job analysis:
                         project['skill_match'] = len(project_skills.intersection(priority_skills_set))
                         recommended.append(project)
         
-        # Sort by skill relevance
-        recommended.sort(key=lambda x: x.get('skill_match', 0), reverse=True)
-        
-        return recommended[:8]  # Return top 8 projects
+        # Top 8 projects by skill relevance
+        return heapq.nlargest(8, recommended, key=lambda x: x.get('skill_match', 0))
     
     async def _recommend_courses(self, skill_gaps: List[SkillGap]) -> List[Dict]:
         """Recommend courses for top skill gaps"""
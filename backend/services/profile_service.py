@@ -4,7 +4,9 @@ Manages user profiles, strengths, skills, and personalization data
 """
 
 import os
+import re
 import json
+import asyncio
 from typing import Dict, List, Optional
 from datetime import datetime
 import httpx
@@ -12,6 +14,37 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Template text that is never real, flagged wherever it appears as whole words
+PLACEHOLDER_PHRASES = (
+    'your.email@example.com', 'test@example.com', 'your full name', 'lorem ipsum'
+)
+
+# Placeholders that are only fake as an entire field; as part of longer text
+# ("sample size", a portfolio on example.com) they can be legitimate
+PLACEHOLDER_VALUES = frozenset((
+    'company name', 'university name', 'project name', 'placeholder',
+    'example.com', 'john doe', 'jane doe'
+))
+
+# Compiled once so validating a profile is a single scan per string
+_PLACEHOLDER_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(p) for p in sorted(PLACEHOLDER_PHRASES, key=len, reverse=True)) + r')(?!\w)',
+    re.IGNORECASE
+)
+
+def _iter_strings(obj):
+    """Yield every string (dict keys included) in a JSON-like structure"""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_strings(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _iter_strings(item)
+
 class ProfileService:
     """Manages user profile data and personalization"""
     
@@ -19,6 +52,10 @@ class ProfileService:
         self.user_id = user_id
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_KEY')
+        
+        # profile_data row for this user, read once and kept current by
+        # successful field updates (write-through)
+        self._profile_data: Optional[Dict] = None
     
     async def get_profile_data(self) -> Dict:
         """
@@ -26,11 +63,12 @@ class ProfileService:
         Returns user's strengths, skills, experience, etc.
         """
         
-        # Get basic profile
-        basic_profile = await self._get_basic_profile()
-        
-        # Get detailed profile data
-        profile_data = await self._get_profile_data()
+        # Basic profile and detailed profile data are independent reads,
+        # so overlap the two Supabase round-trips
+        basic_profile, profile_data = await asyncio.gather(
+            self._get_basic_profile(),
+            self._get_profile_data()
+        )
         
         # Combine and format for AI use
         return {
@@ -169,6 +207,26 @@ If information is missing, state "Not specified" rather than inventing data.
             'recommendations': self._get_profile_recommendations(missing_sections)
         }
     
+    async def validate_profile_data(self, data: Dict) -> Dict:
+        """
+        Reject profile updates that still contain placeholder/fake text
+        """
+        
+        # Scan the string leaves in place rather than serialising the whole payload first
+        matches = {}
+        for text in _iter_strings(data):
+            value = text.strip().lower()
+            if value in PLACEHOLDER_VALUES:
+                matches[value] = None
+            for match in _PLACEHOLDER_RE.findall(text):
+                matches[match.lower()] = None
+        errors = [f"Placeholder text found: '{m}'" for m in matches]
+        
+        return {
+            'is_valid': not errors,
+            'errors': errors
+        }
+    
     # Private helper methods
     async def _get_basic_profile(self) -> Dict:
         """Get basic profile information"""
@@ -192,6 +250,9 @@ If information is missing, state "Not specified" rather than inventing data.
     async def _get_profile_data(self) -> Dict:
         """Get detailed profile data"""
         
+        if self._profile_data is not None:
+            return self._profile_data
+        
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 f"{self.supabase_url}/rest/v1/profile_data",
@@ -204,7 +265,8 @@ If information is missing, state "Not specified" rather than inventing data.
             
             if response.status_code == 200:
                 data = response.json()
-                return data[0] if data else {}
+                self._profile_data = data[0] if data else {}
+                return self._profile_data
             
             return {}
     
@@ -228,7 +290,11 @@ If information is missing, state "Not specified" rather than inventing data.
                 }
             )
             
-            return response.status_code in [200, 204]
+            success = response.status_code in [200, 204]
+            if success and self._profile_data is not None:
+                self._profile_data.update(update_data)
+            
+            return success
     
     def _format_list(self, items: List[str]) -> str:
         """Format list for AI context"""
@@ -4,19 +4,28 @@ Real, working job API with 1000 free searches per month
 """
 
 import os
+import json
+import time
+import hashlib
 import httpx
 import asyncio
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from urllib.parse import quote_plus
 
+from .optional_deps import HTTP2_AVAILABLE, parse_json
+from .rate_limiter import adzuna_limiter
+
+
 class AdzunaJobSearch:
     """
     Adzuna API integration for real job discovery
     Free tier: 1000 API calls per month
     """
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, cache_dir: str = "data/cache/adzuna",
+                 cache_ttl: int = 6 * 3600):
         self.app_id = os.getenv('ADZUNA_APP_ID', '5305c49d')
         self.api_key = os.getenv('ADZUNA_API_KEY', '13a9a9862ef8dba5e373ba5f197773ef')
         
@@ -30,6 +39,44 @@ class AdzunaJobSearch:
             'ca': 'Canada',
             'au': 'Australia'
         }
+        
+        # Cap in-flight requests; the request rate is limited by the
+        # process-wide Adzuna token bucket
+        self._sem = asyncio.Semaphore(5)
+        
+        # On-disk response cache keyed by (query params, day), expires after cache_ttl seconds
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir)
+        self.cache_ttl = cache_ttl
+        self._cache_pruned = False
+        
+        # Shared HTTP client, created on first use so queries reuse connections
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def start(self) -> httpx.AsyncClient:
+        """Create the shared keep-alive client if it isn't running yet"""
+        
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=30,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+            )
+        return self.client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
     
     async def search_jobs(
         self, 
@@ -39,7 +86,8 @@ class AdzunaJobSearch:
         results_per_page: int = 50,
         max_days_old: int = 30,
         salary_min: int = None,
-        full_time: bool = None
+        full_time: bool = None,
+        seen_ids: Optional[set] = None
     ) -> List[Dict]:
         """
         Search for jobs using Adzuna API
@@ -52,6 +100,8 @@ class AdzunaJobSearch:
             max_days_old: Only jobs posted within X days
             salary_min: Minimum salary filter
             full_time: Full-time only filter
+            seen_ids: Adzuna ids already collected; matching results are skipped
+                before cleaning (the set is updated with new ids)
         
         Returns:
             List of job dictionaries
@@ -82,30 +132,104 @@ class AdzunaJobSearch:
         if full_time is not None:
             params['full_time'] = 1 if full_time else 0
         
-        async with httpx.AsyncClient(timeout=30) as client:
-            try:
-                response = await client.get(url, params=params)
+        cache_key = self._cache_key(url, params)
+        
+        try:
+            # Cache file reads/writes run in a worker thread so they don't stall
+            # the other queries sharing this event loop
+            data = await asyncio.to_thread(self._read_cache, cache_key)
+            if data is None:
+                client = await self.start()
+                await adzuna_limiter.acquire()
+                async with self._sem:
+                    response = await client.get(url, params=params)
                 response.raise_for_status()
                 
-                data = response.json()
-                jobs = self._parse_adzuna_response(data, country)
-                
-                print(f"  Adzuna: Found {len(jobs)} jobs for '{query[:50]}'")
-                return jobs
-                
-            except httpx.HTTPError as e:
-                print(f"  Adzuna API error: {e}")
-                return []
-            except Exception as e:
-                print(f"  Adzuna error: {e}")
-                return []
+                data = parse_json(response)
+                await asyncio.to_thread(self._write_cache, cache_key, data)
+            
+            # Parse/clean off the event loop so other queries keep flowing
+            jobs = await asyncio.to_thread(self._parse_adzuna_response, data, country, seen_ids)
+            
+            print(f"  Adzuna: Found {len(jobs)} jobs for '{query[:50]}'")
+            return jobs
+            
+        except httpx.HTTPError as e:
+            print(f"  Adzuna API error: {e}")
+            return []
+        except Exception as e:
+            print(f"  Adzuna error: {e}")
+            return []
+    
+    def _cache_key(self, url: str, params: Dict) -> str:
+        """Build a cache key from the request (minus credentials) and today's date"""
+        
+        query_params = {k: v for k, v in params.items() if k not in ('app_id', 'app_key')}
+        raw = f"{url}|{json.dumps(query_params, sort_keys=True)}|{datetime.now():%Y%m%d}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def _read_cache(self, cache_key: str) -> Optional[Dict]:
+        """Return the cached Adzuna response for this key if present and not expired"""
+        
+        if not self.use_cache:
+            return None
+        
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            return json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
     
-    def _parse_adzuna_response(self, data: Dict, country: str) -> List[Dict]:
+    def _write_cache(self, cache_key: str, data: Dict):
+        """Store the raw Adzuna response for this key"""
+        
+        if not self.use_cache:
+            return
+        
+        # Keys are per day, so expired entries are never read again; clear them once per searcher
+        if not self._cache_pruned:
+            self._cache_pruned = True
+            self._prune_cache()
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{cache_key}.json").write_text(json.dumps(data), encoding='utf-8')
+        except OSError as e:
+            print(f"  Adzuna cache write failed: {e}")
+    
+    def _prune_cache(self):
+        """Delete cached responses older than cache_ttl"""
+        
+        cutoff = time.time() - self.cache_ttl
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+        except OSError:
+            pass  # Missing directory or a file removed concurrently
+    
+    def _parse_adzuna_response(self, data: Dict, country: str,
+                               seen_ids: Optional[set] = None) -> List[Dict]:
         """Parse Adzuna API response into standardized job format"""
         
         jobs = []
         
+        # One timestamp per response: cheaper and consistent across its jobs
+        now = datetime.now()
+        discovered_date = now.isoformat()
+        
         for item in data.get('results', []):
+            # Skip results another query already returned, before any cleaning work
+            if seen_ids is not None:
+                item_id = item.get('id')
+                if item_id in seen_ids:
+                    continue
+                if item_id:
+                    seen_ids.add(item_id)
+            
             # Extract job information
             job = {
                 'title': item.get('title', ''),
@@ -122,20 +246,22 @@ class AdzunaJobSearch:
                 'source': 'Adzuna',
                 'country': self.countries.get(country, country),
                 'job_id': item.get('id'),
-                'discovered_date': datetime.now().isoformat()
+                'discovered_date': discovered_date
             }
             
             # Clean up the data
-            job = self._clean_job_data(job)
+            job = self._clean_job_data(job, now)
             
             if job['title'] and job['company']:
                 jobs.append(job)
         
         return jobs
     
-    def _clean_job_data(self, job: Dict) -> Dict:
+    def _clean_job_data(self, job: Dict, now: Optional[datetime] = None) -> Dict:
         """Clean and standardize job data"""
         
+        now = now or datetime.now()
+        
         # Clean HTML from description
         import re
         if job.get('description'):
@@ -156,7 +282,7 @@ class AdzunaJobSearch:
         if job.get('created'):
             try:
                 created_date = datetime.fromisoformat(job['created'].replace('Z', '+00:00'))
-                days_old = (datetime.now() - created_date.replace(tzinfo=None)).days
+                days_old = (now - created_date.replace(tzinfo=None)).days
                 job['days_old'] = days_old
                 job['is_fresh'] = days_old <= 7  # Posted within a week
             except:
@@ -197,18 +323,23 @@ class AdzunaJobSearch:
         
         for query in queries:
             print(f"  Searching Adzuna: {query[:60]}...")
-            
-            jobs = await self.search_jobs(query, location, **kwargs)
-            
+        
+        # Run queries concurrently; search_jobs rate-limits and caps in-flight
+        # requests instead of sleeping between queries. Sharing
+        # fetched_ids lets each parse skip results an earlier response had.
+        fetched_ids = set()
+        results = await asyncio.gather(
+            *(self.search_jobs(query, location, seen_ids=fetched_ids, **kwargs)
+              for query in queries)
+        )
+        
+        for jobs in results:
             # Deduplicate by job ID
             for job in jobs:
                 job_id = job.get('job_id')
                 if job_id and job_id not in seen_ids:
                     seen_ids.add(job_id)
                     all_jobs.append(job)
-            
-            # Rate limiting (Adzuna has 5 requests per second limit)
-            await asyncio.sleep(0.3)
         
         return all_jobs
     
@@ -227,17 +358,17 @@ class AdzunaJobSearch:
         if location:
             params['where'] = location
         
-        async with httpx.AsyncClient(timeout=30) as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                return data.get('leaderboard', [])
-                
-            except Exception as e:
-                print(f"  Adzuna top companies error: {e}")
-                return []
+        client = await self.start()
+        try:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            data = parse_json(response)
+            return data.get('leaderboard', [])
+            
+        except Exception as e:
+            print(f"  Adzuna top companies error: {e}")
+            return []
     
     async def get_salary_stats(self, job_title: str, location: str = "", country: str = "us") -> Dict:
         """Get salary statistics for a job title"""
@@ -255,26 +386,26 @@ class AdzunaJobSearch:
         if location:
             params['where'] = location
         
-        async with httpx.AsyncClient(timeout=30) as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Get latest month's data
-                if data.get('month'):
-                    latest = list(data['month'].values())[-1]
-                    return {
-                        'average_salary': latest.get('salary', 0),
-                        'job_count': latest.get('count', 0)
-                    }
-                
-                return {}
-                
-            except Exception as e:
-                print(f"  Adzuna salary stats error: {e}")
-                return {}
+        client = await self.start()
+        try:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            data = parse_json(response)
+            
+            # Get latest month's data
+            if data.get('month'):
+                latest = list(data['month'].values())[-1]
+                return {
+                    'average_salary': latest.get('salary', 0),
+                    'job_count': latest.get('count', 0)
+                }
+            
+            return {}
+            
+        except Exception as e:
+            print(f"  Adzuna salary stats error: {e}")
+            return {}
 
 
 # Test the Adzuna API
@@ -287,71 +418,74 @@ async def test_adzuna_search():
     
     searcher = AdzunaJobSearch()
     
-    # Test queries for new grad software engineer
-    test_queries = [
-        "software engineer graduate",
-        "software developer entry level",
-        "junior software engineer",
-        "software engineer new grad",
-        "python developer junior"
-    ]
-    
-    print(f"\nSearching for new grad positions...")
-    print("-" * 60)
-    
-    # Search with multiple queries
-    all_jobs = await searcher.search_multiple_queries(
-        queries=test_queries[:3],  # Limit to conserve API calls
-        location="",  # Search entire US
-        max_days_old=30,  # Fresh postings only
-        salary_min=70000  # Minimum salary filter
-    )
-    
-    print(f"\nRESULTS:")
-    print(f"Total jobs found: {len(all_jobs)}")
-    
-    # Analyze results
-    fresh_jobs = [j for j in all_jobs if j.get('is_fresh')]
-    high_salary = [j for j in all_jobs if j.get('salary_min', 0) >= 80000]
-    
-    print(f"Fresh jobs (<=7 days): {len(fresh_jobs)}")
-    print(f"High salary ($80k+): {len(high_salary)}")
-    
-    # Show top 10 jobs
-    print(f"\nTOP JOBS FOUND:")
-    print("-" * 60)
-    
-    for i, job in enumerate(all_jobs[:10], 1):
-        print(f"\n{i}. {job['title']}")
-        print(f"   Company: {job['company']}")
-        print(f"   Location: {job['location']}")
-        if job.get('salary_formatted'):
-            print(f"   Salary: {job['salary_formatted']}")
-        if job.get('days_old') is not None:
-            print(f"   Posted: {job['days_old']} days ago")
-        print(f"   URL: {job['url'][:70]}...")
-    
-    # Test salary statistics
-    print(f"\nSALARY STATISTICS:")
-    print("-" * 60)
-    
-    stats = await searcher.get_salary_stats("software engineer", "San Francisco")
-    if stats:
-        print(f"Average salary in San Francisco: ${stats.get('average_salary', 0):,.0f}")
-        print(f"Number of jobs: {stats.get('job_count', 0)}")
-    
-    # Test top companies
-    print(f"\nTOP HIRING COMPANIES:")
-    print("-" * 60)
-    
-    companies = await searcher.get_top_companies()
-    for i, company in enumerate(companies[:5], 1):
-        print(f"{i}. {company.get('canonical_name', 'Unknown')} - {company.get('count', 0)} jobs")
-    
-    print(f"\nAdzuna API test complete!")
-    print(f"API calls used: ~{len(test_queries) + 2} (out of 1000 monthly limit)")
-    
-    return all_jobs
+    try:
+        # Test queries for new grad software engineer
+        test_queries = [
+            "software engineer graduate",
+            "software developer entry level",
+            "junior software engineer",
+            "software engineer new grad",
+            "python developer junior"
+        ]
+        
+        print(f"\nSearching for new grad positions...")
+        print("-" * 60)
+        
+        # Search with multiple queries
+        all_jobs = await searcher.search_multiple_queries(
+            queries=test_queries[:3],  # Limit to conserve API calls
+            location="",  # Search entire US
+            max_days_old=30,  # Fresh postings only
+            salary_min=70000  # Minimum salary filter
+        )
+        
+        print(f"\nRESULTS:")
+        print(f"Total jobs found: {len(all_jobs)}")
+        
+        # Analyze results
+        fresh_jobs = [j for j in all_jobs if j.get('is_fresh')]
+        high_salary = [j for j in all_jobs if j.get('salary_min', 0) >= 80000]
+        
+        print(f"Fresh jobs (<=7 days): {len(fresh_jobs)}")
+        print(f"High salary ($80k+): {len(high_salary)}")
+        
+        # Show top 10 jobs
+        print(f"\nTOP JOBS FOUND:")
+        print("-" * 60)
+        
+        for i, job in enumerate(all_jobs[:10], 1):
+            print(f"\n{i}. {job['title']}")
+            print(f"   Company: {job['company']}")
+            print(f"   Location: {job['location']}")
+            if job.get('salary_formatted'):
+                print(f"   Salary: {job['salary_formatted']}")
+            if job.get('days_old') is not None:
+                print(f"   Posted: {job['days_old']} days ago")
+            print(f"   URL: {job['url'][:70]}...")
+        
+        # Test salary statistics
+        print(f"\nSALARY STATISTICS:")
+        print("-" * 60)
+        
+        stats = await searcher.get_salary_stats("software engineer", "San Francisco")
+        if stats:
+            print(f"Average salary in San Francisco: ${stats.get('average_salary', 0):,.0f}")
+            print(f"Number of jobs: {stats.get('job_count', 0)}")
+        
+        # Test top companies
+        print(f"\nTOP HIRING COMPANIES:")
+        print("-" * 60)
+        
+        companies = await searcher.get_top_companies()
+        for i, company in enumerate(companies[:5], 1):
+            print(f"{i}. {company.get('canonical_name', 'Unknown')} - {company.get('count', 0)} jobs")
+        
+        print(f"\nAdzuna API test complete!")
+        print(f"API calls used: ~{len(test_queries) + 2} (out of 1000 monthly limit)")
+        
+        return all_jobs
+    finally:
+        await searcher.close()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,27 @@ import os
 import httpx
 import asyncio
 import json
+import functools
+from pathlib import Path
 from typing import Dict, Optional, List
 from datetime import datetime
 from .profile_manager import ProfileManager
 
+TEMPLATES_DIR = Path(__file__).resolve().parents[2] / 'data' / 'templates'
+
+# Summary themes checked in order; the first whose terms appear in the job wins
+SUMMARY_THEMES = (
+    ('ai_ml', ('ai', 'ml', 'machine learning', 'computer vision')),
+    ('full_stack', ('full stack', 'fullstack', 'web development')),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> str:
+    """Load a content template from data/templates once per process"""
+    return (TEMPLATES_DIR / f"{name}.txt").read_text(encoding='utf-8').rstrip('\n')
+
+
 class AIContentGeneratorV2:
     """
     Enhanced AI content generator with zero fake data guarantee
@@ -21,6 +38,13 @@ class AIContentGeneratorV2:
         # Load real profile data
         self.profile = ProfileManager(profile_path)
         
+        # Professional summary builder per job theme (see SUMMARY_THEMES)
+        self._summary_builders = {
+            'ai_ml': self._ai_ml_summary,
+            'full_stack': self._full_stack_summary,
+            'general': self._general_summary
+        }
+        
         # API Keys
         self.openai_key = os.getenv('OPENAI_API_KEY')
         self.anthropic_key = os.getenv('ANTHROPIC_API_KEY') or os.getenv('LLM_API_KEY')
@@ -486,55 +510,52 @@ Format as detailed markdown with actionable steps and specific resources."""
         skills = self._extract_skills_from_job(job)
         matching_skills = []
         
+        # Each skill list feeds both the matching and the template, so fetch once
+        languages = self.profile.get_programming_languages()
+        frameworks = self.profile.get_frameworks()
+        ai_ml = self.profile.get_ai_ml_skills()
+        
         # Find skills that match candidate's profile
-        candidate_skills = (self.profile.get_programming_languages() + 
-                           self.profile.get_frameworks() + 
-                           self.profile.get_ai_ml_skills())
+        candidate_skills = languages + frameworks + ai_ml
+        candidate_lower = [candidate_skill.lower() for candidate_skill in candidate_skills]
         
         for skill in skills:
-            for candidate_skill in candidate_skills:
-                if skill.lower() in candidate_skill.lower() or candidate_skill.lower() in skill.lower():
+            skill_lower = skill.lower()
+            for candidate_skill in candidate_lower:
+                if skill_lower in candidate_skill or candidate_skill in skill_lower:
                     matching_skills.append(skill)
         
-        resume_content = f"""# {self.profile.get_name()}
-**{job.get('title', 'Software Engineer')} | AI Enthusiast | NCAA Athlete**
-
-{self.profile.get_email()} | {self.profile.get_phone()}
-{self.profile.get_github()} | {self.profile.get_linkedin()}
-Location: {self.profile.get_location()}
-
-## Professional Summary
-{self._generate_summary_for_job(job)}
-
-## Education
-**{self.profile.get_degree()}** | GPA: {self.profile.get_gpa()}
-{self.profile.get_school()} | Graduating {self.profile.get_graduation()}
-Relevant Coursework: {', '.join(self.profile.get_coursework()[:4])}
-
-## Technical Skills
-**Languages**: {', '.join(self.profile.get_programming_languages())}
-**Frameworks**: {', '.join(self.profile.get_frameworks())}
-**AI/ML**: {', '.join(self.profile.get_ai_ml_skills())}
-**Databases**: {', '.join(self.profile.get_databases())}
-**Cloud/Tools**: {', '.join(self.profile.get_cloud_skills() + self.profile.get_tools()[:3])}
-
-## Experience
-{self.profile.get_experience_summary()}
-
-## Projects
-{self.profile.get_projects_summary()}
-
-## Achievements"""
-
-        for achievement in self.profile.get_achievements():
-            resume_content += f"\n• **{achievement['title']}**: {achievement['impact']}"
-
-        resume_content += f"""
-
-## Additional Qualifications
-{chr(10).join('• ' + strength for strength in self.profile.get_strengths())}
-• Visa Status: {self.profile.get_visa_status()}
-• Available: {self.profile.get_availability()}"""
+        achievements = ''.join(
+            f"\n• **{achievement['title']}**: {achievement['impact']}"
+            for achievement in self.profile.get_achievements()
+        )
+
+        resume_content = _load_template('resume').format(
+            name=self.profile.get_name(),
+            title=job.get('title', 'Software Engineer'),
+            email=self.profile.get_email(),
+            phone=self.profile.get_phone(),
+            github=self.profile.get_github(),
+            linkedin=self.profile.get_linkedin(),
+            location=self.profile.get_location(),
+            summary=self._generate_summary_for_job(job),
+            degree=self.profile.get_degree(),
+            gpa=self.profile.get_gpa(),
+            school=self.profile.get_school(),
+            graduation=self.profile.get_graduation(),
+            coursework=', '.join(self.profile.get_coursework()[:4]),
+            languages=', '.join(languages),
+            frameworks=', '.join(frameworks),
+            ai_ml=', '.join(ai_ml),
+            databases=', '.join(self.profile.get_databases()),
+            cloud_tools=', '.join(self.profile.get_cloud_skills() + self.profile.get_tools()[:3]),
+            experience=self.profile.get_experience_summary(),
+            projects=self.profile.get_projects_summary(),
+            achievements=achievements,
+            strengths=chr(10).join('• ' + strength for strength in self.profile.get_strengths()),
+            visa_status=self.profile.get_visa_status(),
+            availability=self.profile.get_availability()
+        )
         
         return {
             'content': resume_content,
@@ -547,23 +568,26 @@ Relevant Coursework: {', '.join(self.profile.get_coursework()[:4])}
     def _generate_template_cover_letter(self, job: Dict) -> Dict:
         """Generate cover letter using template with real profile data"""
         
-        cover_letter = f"""Dear {job.get('company', 'Hiring Team')} Team,
-
-I am writing to express my strong interest in the {job.get('title', 'Software Engineer')} position at {job.get('company', 'your company')}. As a {self.profile.get_degree()} student at {self.profile.get_school()} graduating in {self.profile.get_graduation()}, I am excited about the opportunity to contribute to your team.
-
-{self._generate_body_paragraph(job)}
-
-My unique combination of technical expertise and diverse background sets me apart:
-{chr(10).join('• ' + strength for strength in self.profile.get_strengths()[:3])}
-
-Through my projects including {self.profile.get_projects()[0]['name']} and {self.profile.get_projects()[1]['name']}, I have demonstrated my ability to build scalable, innovative applications. My experience as a {self.profile.get_experience()[0]['title']} has strengthened my {', '.join(self.profile.get_soft_skills()[:3])}.
-
-I am available for full-time employment starting {self.profile.get_availability()} and have {self.profile.get_visa_status()}. I would welcome the opportunity to discuss how my skills and unique perspective can contribute to {job.get('company', 'your organization')}'s success.
-
-Thank you for your consideration.
-
-Sincerely,
-{self.profile.get_name()}"""
+        projects = self.profile.get_projects()
+        
+        cover_letter = _load_template('cover_letter').format(
+            company_name=job.get('company', 'Hiring Team'),
+            title=job.get('title', 'Software Engineer'),
+            company=job.get('company', 'your company'),
+            degree=self.profile.get_degree(),
+            school=self.profile.get_school(),
+            graduation=self.profile.get_graduation(),
+            body_paragraph=self._generate_body_paragraph(job),
+            strengths=chr(10).join('• ' + strength for strength in self.profile.get_strengths()[:3]),
+            project_1=projects[0]['name'],
+            project_2=projects[1]['name'],
+            experience_title=self.profile.get_experience()[0]['title'],
+            soft_skills=', '.join(self.profile.get_soft_skills()[:3]),
+            availability=self.profile.get_availability(),
+            visa_status=self.profile.get_visa_status(),
+            organization=job.get('company', 'your organization'),
+            name=self.profile.get_name()
+        )
         
         return {
             'content': cover_letter,
@@ -575,18 +599,23 @@ Sincerely,
     def _generate_summary_for_job(self, job: Dict) -> str:
         """Generate professional summary tailored to job"""
         
-        job_description = job.get('description', '').lower()
-        job_title = job.get('title', '').lower()
-        
-        # Identify key themes in the job
-        if any(term in job_description + job_title for term in ['ai', 'ml', 'machine learning', 'computer vision']):
-            return f"Computer Science student at {self.profile.get_school()} with hands-on experience in AI/ML and computer vision. Built {self.profile.get_projects()[0]['name']}, demonstrating expertise in real-time analysis and AI integration. Combining technical skills with unique perspectives from athletics and music to deliver innovative solutions."
+        job_text = job.get('description', '').lower() + job.get('title', '').lower()
         
-        elif any(term in job_description + job_title for term in ['full stack', 'fullstack', 'web development']):
-            return f"Full-stack developer and Computer Science student at {self.profile.get_school()}. Proven ability to build scalable applications demonstrated through {self.profile.get_projects()[0]['name']} and {self.profile.get_projects()[1]['name']}. Strong foundation in {', '.join(self.profile.get_frameworks()[:3])} with {self.profile.get_experience()[0]['title']} experience."
-        
-        else:
-            return f"Motivated Computer Science student at {self.profile.get_school()} with demonstrated experience in software development and AI. Built innovative applications including {self.profile.get_projects()[0]['name']}, combining technical expertise with unique perspective from international background and athletics."
+        # Identify the key theme of the job and dispatch to its builder
+        theme = next(
+            (name for name, terms in SUMMARY_THEMES if any(term in job_text for term in terms)),
+            'general'
+        )
+        return self._summary_builders[theme]()
+    
+    def _ai_ml_summary(self) -> str:
+        return f"Computer Science student at {self.profile.get_school()} with hands-on experience in AI/ML and computer vision. Built {self.profile.get_projects()[0]['name']}, demonstrating expertise in real-time analysis and AI integration. Combining technical skills with unique perspectives from athletics and music to deliver innovative solutions."
+    
+    def _full_stack_summary(self) -> str:
+        return f"Full-stack developer and Computer Science student at {self.profile.get_school()}. Proven ability to build scalable applications demonstrated through {self.profile.get_projects()[0]['name']} and {self.profile.get_projects()[1]['name']}. Strong foundation in {', '.join(self.profile.get_frameworks()[:3])} with {self.profile.get_experience()[0]['title']} experience."
+    
+    def _general_summary(self) -> str:
+        return f"Motivated Computer Science student at {self.profile.get_school()} with demonstrated experience in software development and AI. Built innovative applications including {self.profile.get_projects()[0]['name']}, combining technical expertise with unique perspective from international background and athletics."
     
     def _generate_body_paragraph(self, job: Dict) -> str:
         """Generate body paragraph for cover letter"""
@@ -604,10 +633,12 @@ Sincerely,
                            self.profile.get_frameworks() + 
                            self.profile.get_ai_ml_skills())
         
-        # Find skill gaps
+        # Find skill gaps (lowercase the candidate skills once, not per job skill)
+        candidate_lower = [existing.lower() for existing in candidate_skills]
         missing_skills = []
         for skill in job_skills:
-            if not any(skill.lower() in existing.lower() for existing in candidate_skills):
+            skill_lower = skill.lower()
+            if not any(skill_lower in existing for existing in candidate_lower):
                 missing_skills.append(skill)
         
         learning_path = f"""# Learning Path for {job.get('title')} at {job.get('company')}
@@ -683,10 +714,16 @@ async def test_ai_generator_v2():
     print(f"\n🎯 TEST JOB: {test_job['title']} at {test_job['company']}")
     print("-" * 70)
     
+    # The three generations are independent, so run them concurrently
+    print("\nGenerating resume, cover letter and learning path...")
+    resume, cover_letter, learning_path = await asyncio.gather(
+        generator.generate_tailored_resume(test_job, use_claude=True),
+        generator.generate_cover_letter(test_job),
+        generator.generate_learning_path(test_job)
+    )
+    
     # Test resume generation
     print("\n1. Testing AI Resume Generation...")
-    resume = await generator.generate_tailored_resume(test_job, use_claude=True)
-    
     print(f"✅ Generator: {resume.get('generator')}")
     print(f"✅ Validation: {resume.get('profile_validation')}")
     print(f"✅ ATS Optimized: {resume.get('ats_optimized', 'N/A')}")
@@ -695,8 +732,6 @@ async def test_ai_generator_v2():
     
     # Test cover letter generation
     print("\n2. Testing AI Cover Letter Generation...")
-    cover_letter = await generator.generate_cover_letter(test_job)
-    
     print(f"✅ Generator: {cover_letter.get('generator')}")
     print(f"✅ Validation: {cover_letter.get('profile_validation')}")
     print(f"✅ Personalization: {cover_letter.get('personalization_level', 'N/A')}")
@@ -705,8 +740,6 @@ async def test_ai_generator_v2():
     
     # Test learning path generation
     print("\n3. Testing Learning Path Generation...")
-    learning_path = await generator.generate_learning_path(test_job)
-    
     print(f"✅ Generator: {learning_path.get('generator', 'Basic')}")
     print(f"✅ Job Focus: {learning_path.get('job_title', test_job['title'])}")
     print(f"\nLearning Path Preview (first 400 chars):")
@@ -6,6 +6,8 @@ Provides much better coverage than Adzuna alone
 import os
 import json
 import time
+import pickle
+import itertools
 import hashlib
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
@@ -15,16 +17,61 @@ import asyncio
 import aiohttp
 from urllib.parse import quote
 
+# Most recent job hashes kept across runs; older ones are dropped on save
+SEEN_JOBS_CAP = int(os.getenv('SEEN_JOBS_CAP', '10000'))
+
 class ComprehensiveJobAggregator:
     """
     Aggregates jobs from multiple sources for maximum coverage.
     Free and paid API options included.
     """
     
-    def __init__(self):
+    def __init__(self, seen_jobs_path: str = None):
         self.results = []
-        self.seen_jobs = set()  # Deduplication
+        # Optional pickle of job hashes so dedup carries across runs
+        self.seen_jobs_path = seen_jobs_path
+        # Deduplication; a dict rather than a set so hashes stay in insertion
+        # order and the oldest can be trimmed when persisting
+        self.seen_jobs = self._load_seen_jobs()
+    
+    def _load_seen_jobs(self) -> Dict[str, None]:
+        """Load job hashes saved by a previous run, if persistence is enabled"""
+        if not self.seen_jobs_path:
+            return {}
         
+        try:
+            with open(self.seen_jobs_path, 'rb') as f:
+                # Older runs pickled a plain set
+                return dict.fromkeys(pickle.load(f))
+        except (OSError, EOFError, pickle.UnpicklingError, TypeError):
+            # Missing or corrupt file - start fresh
+            return {}
+    
+    def _save_seen_jobs(self):
+        """Persist job hashes so the next run can skip jobs already seen"""
+        if not self.seen_jobs_path:
+            return
+        
+        # Keep only the newest hashes so the file doesn't grow forever
+        overflow = len(self.seen_jobs) - SEEN_JOBS_CAP
+        if overflow > 0:
+            for job_hash in list(itertools.islice(self.seen_jobs, overflow)):
+                del self.seen_jobs[job_hash]
+        
+        os.makedirs(os.path.dirname(self.seen_jobs_path) or '.', exist_ok=True)
+        with open(self.seen_jobs_path, 'wb') as f:
+            pickle.dump(self.seen_jobs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+    def _mark_seen(self, job_hash: str) -> bool:
+        """Record a sighting of a job, returning True if it hasn't been seen before"""
+        # Re-inserting moves a repeat to the newest end, so the trim on save
+        # drops hashes that stopped appearing rather than long-running postings
+        is_new = job_hash not in self.seen_jobs
+        if not is_new:
+            del self.seen_jobs[job_hash]
+        self.seen_jobs[job_hash] = None
+        return is_new
+    
     def generate_job_hash(self, company: str, title: str, location: str = "") -> str:
         """Generate unique hash for job deduplication"""
         text = f"{company.lower()}{title.lower()}{location.lower()}"
@@ -57,8 +104,7 @@ class ComprehensiveJobAggregator:
                         job.get('title', '')
                     )
                     
-                    if job_hash not in self.seen_jobs:
-                        self.seen_jobs.add(job_hash)
+                    if self._mark_seen(job_hash):
                         jobs.append({
                             'source': 'Remotive',
                             'title': job.get('title', ''),
@@ -108,8 +154,7 @@ class ComprehensiveJobAggregator:
                         job.get('PositionTitle', '')
                     )
                     
-                    if job_hash not in self.seen_jobs:
-                        self.seen_jobs.add(job_hash)
+                    if self._mark_seen(job_hash):
                         
                         # Parse salary range
                         salary_min = job.get('PositionRemuneration', [{}])[0].get('MinimumRange', '')
@@ -161,8 +206,7 @@ class ComprehensiveJobAggregator:
                                     url = parts[1].split(')')[0]
                                     
                                     job_hash = self.generate_job_hash(company, "Engineering Role")
-                                    if job_hash not in self.seen_jobs:
-                                        self.seen_jobs.add(job_hash)
+                                    if self._mark_seen(job_hash):
                                         jobs.append({
                                             'source': 'GitHub Jobs',
                                             'title': f'Software Engineer at {company}',
@@ -212,8 +256,7 @@ class ComprehensiveJobAggregator:
                         job.get('title', '')
                     )
                     
-                    if job_hash not in self.seen_jobs:
-                        self.seen_jobs.add(job_hash)
+                    if self._mark_seen(job_hash):
                         jobs.append({
                             'source': 'Adzuna',
                             'title': job.get('title', ''),
@@ -267,8 +310,7 @@ class ComprehensiveJobAggregator:
                         job.get('jobTitle', '')
                     )
                     
-                    if job_hash not in self.seen_jobs:
-                        self.seen_jobs.add(job_hash)
+                    if self._mark_seen(job_hash):
                         jobs.append({
                             'source': 'Reed',
                             'title': job.get('jobTitle', ''),
@@ -318,8 +360,7 @@ class ComprehensiveJobAggregator:
                         job.get('role', '')
                     )
                     
-                    if job_hash not in self.seen_jobs:
-                        self.seen_jobs.add(job_hash)
+                    if self._mark_seen(job_hash):
                         jobs.append({
                             'source': 'Findwork',
                             'title': job.get('role', ''),
@@ -463,13 +504,19 @@ class ComprehensiveJobAggregator:
     def save_results(self, results: Dict, filename: str = None):
         """Save aggregated results to JSON file"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Name the file after the search's own timestamp so the two agree
+            searched_at = results.get('timestamp')
+            now = datetime.fromisoformat(searched_at) if searched_at else datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"data/daily_searches/aggregated_jobs_{timestamp}.json"
         
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
+        # Serialise in memory and write once; json.dump issues a write per encoded chunk
         with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+            f.write(json.dumps(results, indent=2))
+        
+        self._save_seen_jobs()
         
         print(f"\n💾 Results saved to: {filename}")
         return filename
@@ -4,9 +4,10 @@ Dedicated service for AI-powered cover letter generation with zero fake data
 """
 
 import os
+import re
 import json
 import asyncio
-from typing import Dict, Optional, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from .ai_content_generator import AIContentGenerator
 from .profile_manager import ProfileManager
@@ -22,6 +23,16 @@ class CoverLetterGenerator:
         self.ai_generator = AIContentGenerator()
         self.profile = ProfileManager()
         self.validation_patterns = self._get_fake_data_patterns()
+        # All patterns in one alternation so validation is a single pass over the letter
+        self._validation_re = re.compile('|'.join(map(re.escape, self.validation_patterns)))
+        
+        # Output directory is created on the first save only
+        self.output_dir = os.path.join('data', 'cover_letters')
+        self._output_dir_ready = False
+        
+        # Profile fields sent with every AI request; the profile doesn't change
+        # between letters, so they're gathered (and summaries formatted) once
+        self._ai_profile: Optional[Dict] = None
     
     def _get_fake_data_patterns(self) -> List[str]:
         """Define patterns that indicate fake data"""
@@ -90,7 +101,10 @@ class CoverLetterGenerator:
     def _prepare_profile_for_ai(self) -> Dict:
         """Prepare profile data for AI generation"""
         
-        return {
+        if self._ai_profile is not None:
+            return self._ai_profile
+        
+        self._ai_profile = {
             'name': self.profile.get_name(),
             'email': self.profile.get_email(),
             'phone': self.profile.get_phone(),
@@ -108,22 +122,21 @@ class CoverLetterGenerator:
             'achievements': self.profile.get_achievements(),
             'unique_angles': self.profile.get_unique_angles()
         }
+        return self._ai_profile
     
     def _validate_no_fake_data(self, content: str) -> Dict:
         """Validate that generated content contains no fake data"""
         
         content_lower = content.lower()
-        detected_patterns = []
-        
-        for pattern in self.validation_patterns:
-            if pattern in content_lower:
-                detected_patterns.append(pattern)
+        found = set(self._validation_re.findall(content_lower))
+        detected_patterns = [pattern for pattern in self.validation_patterns if pattern in found]
         
         # Additional checks
         if '[' in content and ']' in content:
             detected_patterns.append('placeholder brackets')
         
-        if 'xxx' in content_lower or 'placeholder' in content_lower:
+        # 'placeholder' was already checked by the pattern pass above
+        if 'placeholder' in detected_patterns or 'xxx' in content_lower:
             detected_patterns.append('placeholder text')
         
         return {
@@ -195,18 +208,13 @@ Best regards,
         
         print(f"[GENERATE] Generating {count} cover letter variations...")
         
-        variations = []
-        
-        # Generate high-customization version with Claude
-        variations.append(
-            await self.generate_cover_letter(job, "high", use_openai=False)
-        )
-        
-        # Generate medium-customization version with OpenAI  
+        # High-customization version with Claude and, if asked for, a
+        # medium-customization version with OpenAI - independent calls, run together
+        ai_versions = [self.generate_cover_letter(job, "high", use_openai=False)]
         if count >= 2:
-            variations.append(
-                await self.generate_cover_letter(job, "medium", use_openai=True)
-            )
+            ai_versions.append(self.generate_cover_letter(job, "medium", use_openai=True))
+        
+        variations = list(await asyncio.gather(*ai_versions))
         
         # Generate safe template version
         if count >= 3:
@@ -226,10 +234,12 @@ Best regards,
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         filename = f"cover_letter_{company}_{position}_{timestamp}.txt"
-        filepath = os.path.join('data', 'cover_letters', filename)
+        filepath = os.path.join(self.output_dir, filename)
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # Ensure directory exists (once per generator)
+        if not self._output_dir_ready:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._output_dir_ready = True
         
         # Save cover letter content
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -238,7 +248,7 @@ Best regards,
         # Save metadata
         metadata_file = filepath.replace('.txt', '_metadata.json')
         with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(cover_letter, f, indent=2, ensure_ascii=False, default=str)
+            f.write(json.dumps(cover_letter, indent=2, ensure_ascii=False, default=str))
         
         print(f"💾 Saved cover letter: {filepath}")
         return filepath
@@ -9,6 +9,7 @@ import json
 import smtplib
 import schedule
 import time
+import heapq
 from datetime import datetime
 from typing import List, Dict, Optional
 from email.mime.multipart import MIMEMultipart
@@ -87,9 +88,10 @@ class EmailJobDeliveryService:
             
             filtered_jobs.append(job)
         
-        # Sort by score and return top jobs
-        filtered_jobs.sort(key=lambda x: x.get('score', 0), reverse=True)
-        return filtered_jobs[:settings.get('max_jobs_per_email', 20)]
+        # Top jobs by score; a bounded heap instead of sorting every result
+        return heapq.nlargest(
+            settings.get('max_jobs_per_email', 20), filtered_jobs, key=lambda x: x.get('score', 0)
+        )
     
     def generate_email_content(self, user: Dict, jobs: List[Dict]) -> str:
         """Generate personalized email content with job listings"""
@@ -308,7 +310,9 @@ class EmailJobDeliveryService:
         # Keep running
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Sleep straight through to the next due delivery instead of polling
+            idle = schedule.idle_seconds()
+            time.sleep(max(0, idle) if idle is not None else 60)
 
 def main():
     """Main function to run email delivery service"""
@@ -5,13 +5,19 @@ Alternative: Direct Google search parsing (free but limited)
 """
 
 import requests
-from typing import List, Dict, Optional
-import json
+from typing import List, Dict
 import time
-from datetime import datetime, timedelta
 import re
 from urllib.parse import quote_plus
 
+# Job card patterns for the free HTML fallback, compiled once at import
+JOB_CARD_RE = re.compile(r'<div class="PwjeAc".*?>(.*?)</div>', re.DOTALL)
+TITLE_RE = re.compile(r'<div class="BjJfJf PUpOsf">(.*?)</div>')
+COMPANY_RE = re.compile(r'<div class="vNEEBe">(.*?)</div>')
+LOCATION_RE = re.compile(r'<div class="Qk80Jf">(.*?)</div>')
+SALARY_NUMBER_RE = re.compile(r'[\$£€]?([\d,]+)K?')
+HTML_TAG_RE = re.compile('<.*?>')
+
 class GoogleJobsSearcher:
     """Search Google Jobs - aggregates from 100+ job boards"""
     
@@ -125,14 +131,13 @@ class GoogleJobsSearcher:
                     content = response.text
                     
                     # Extract job cards using regex (fragile but works)
-                    job_pattern = r'<div class="PwjeAc".*?>(.*?)</div>'
-                    matches = re.findall(job_pattern, content, re.DOTALL)
+                    matches = JOB_CARD_RE.findall(content)
                     
                     for match in matches[:10]:  # Limit to 10 per page
                         # Extract basic info (this is simplified)
-                        title_match = re.search(r'<div class="BjJfJf PUpOsf">(.*?)</div>', match)
-                        company_match = re.search(r'<div class="vNEEBe">(.*?)</div>', match)
-                        location_match = re.search(r'<div class="Qk80Jf">(.*?)</div>', match)
+                        title_match = TITLE_RE.search(match)
+                        company_match = COMPANY_RE.search(match)
+                        location_match = LOCATION_RE.search(match)
                         
                         if title_match:
                             job = {
@@ -163,7 +168,7 @@ class GoogleJobsSearcher:
         }
         
         # Extract numbers from salary string
-        numbers = re.findall(r'[\$£€]?([\d,]+)K?', salary_string)
+        numbers = SALARY_NUMBER_RE.findall(salary_string)
         
         if numbers:
             # Convert to integers
@@ -189,7 +194,7 @@ class GoogleJobsSearcher:
     
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags from text"""
-        clean = re.sub('<.*?>', '', text)
+        clean = HTML_TAG_RE.sub('', text)
         return clean.strip()
     
     def search_with_filters(self, profile: Dict, serpapi_key: str = None) -> List[Dict]:
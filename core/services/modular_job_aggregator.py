@@ -5,20 +5,33 @@ Searches multiple sources, gracefully handles failures, always returns best jobs
 
 import os
 import json
+import heapq
+import operator
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from collections import Counter
+from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+from .optional_deps import ORJSON_AVAILABLE, orjson, parse_json
+
+# Optional: match every profile skill in one pass over a description
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 class JobSource(Enum):
     """Enum for job sources with priority weights"""
     ADZUNA = ("Adzuna", 1.0, True)  # (name, weight, requires_api_key)
@@ -73,15 +86,14 @@ class Job:
         if self.match_reasons is None:
             self.match_reasons = []
     
-    def to_dict(self) -> Dict:
+    def to_dict(self, include_description: bool = True) -> Dict:
         """Convert to dictionary for JSON serialization"""
-        return {
+        data = {
             'title': self.title,
             'company': self.company,
             'location': self.location,
             'source': self.source,
             'url': self.url,
-            'description': self.description[:500] if self.description else '',
             'salary_min': self.salary_min,
             'salary_max': self.salary_max,
             'posted_date': self.posted_date,
@@ -92,6 +104,9 @@ class Job:
             'match_reasons': self.match_reasons,
             'job_hash': self.job_hash
         }
+        if include_description:
+            data['description'] = self.description[:500] if self.description else ''
+        return data
 
 
 class JobSourceAdapter:
@@ -157,7 +172,7 @@ class AdzunaAdapter(JobSourceAdapter):
         response = self._safe_request(url, params=params)
         if response:
             try:
-                data = response.json()
+                data = parse_json(response)
                 for item in data.get('results', []):
                     job = Job(
                         title=item.get('title', ''),
@@ -192,7 +207,7 @@ class RemotiveAdapter(JobSourceAdapter):
         response = self._safe_request(url, params=params)
         if response:
             try:
-                data = response.json()
+                data = parse_json(response)
                 for item in data.get('jobs', []):
                     job = Job(
                         title=item.get('title', ''),
@@ -234,7 +249,7 @@ class USAJobsAdapter(JobSourceAdapter):
         response = self._safe_request(url, params=params, headers=headers)
         if response:
             try:
-                data = response.json()
+                data = parse_json(response)
                 for item in data.get('SearchResult', {}).get('SearchResultItems', []):
                     desc = item.get('MatchedObjectDescriptor', {})
                     
@@ -286,7 +301,7 @@ class TheMuseAdapter(JobSourceAdapter):
         response = self._safe_request(url, params=params)
         if response:
             try:
-                data = response.json()
+                data = parse_json(response)
                 for item in data.get('results', []):
                     # TheMuse includes company info
                     company_name = item.get('company', {}).get('name', 'Unknown')
@@ -363,28 +378,29 @@ class ModularJobAggregator:
             
             # Collect results as they complete
             for future in as_completed(future_to_source):
-                source = future_to_source[future]
+                name = future_to_source[future].display_name
                 try:
                     jobs = future.result(timeout=15)
                     
                     # Deduplicate and add to results
                     unique_jobs = []
                     for job in jobs:
-                        if job.job_hash not in self.seen_jobs:
-                            self.seen_jobs.add(job.job_hash)
+                        job_hash = job.job_hash
+                        if job_hash not in self.seen_jobs:
+                            self.seen_jobs.add(job_hash)
                             all_jobs.append(job)
                             unique_jobs.append(job)
                     
-                    source_stats[source.display_name] = {
+                    source_stats[name] = {
                         'found': len(jobs),
                         'unique': len(unique_jobs)
                     }
                     
-                    logger.info(f"  {source.display_name}: {len(jobs)} found, {len(unique_jobs)} unique")
+                    logger.info(f"  {name}: {len(jobs)} found, {len(unique_jobs)} unique")
                     
                 except Exception as e:
-                    logger.error(f"  {source.display_name} failed: {e}")
-                    source_stats[source.display_name] = {'found': 0, 'unique': 0}
+                    logger.error(f"  {name} failed: {e}")
+                    source_stats[name] = {'found': 0, 'unique': 0}
         
         # Log summary
         total_unique = len(all_jobs)
@@ -400,34 +416,52 @@ class ModularJobAggregator:
         """
         Score jobs based on user profile and preferences
         """
+        # Profile-derived scoring tables, built once per batch rather than per job
+        preferences = user_profile.get('preferences', {})
+        desired_roles = [(role, role.lower()) for role in preferences.get('desired_roles', [])]
+        preferred_locations = [(loc, loc.lower()) for loc in preferences.get('preferred_locations', [])]
+        remote_only = preferences.get('remote_preference') == 'Remote Only'
+        min_salary = preferences.get('min_salary', 0)
+        max_salary = preferences.get('max_salary', 999999)
+        
+        profile_skills = user_profile.get('skills', {})
+        skills = [
+            (skill, skill.lower())
+            for category in ['languages', 'frameworks', 'databases', 'tools']
+            for skill in profile_skills.get(category, [])
+            if skill
+        ]
+        skill_automaton = self._build_skill_automaton(skills) if AHOCORASICK_AVAILABLE and skills else None
+        
+        # First matching source wins, as in the JobSource scan this replaces
+        source_weights = {}
+        for source in JobSource:
+            source_weights.setdefault(source.display_name, source.weight)
+        
         for job in jobs:
             score = 0.0
             match_reasons = []
             
             # Title match
-            desired_roles = user_profile.get('preferences', {}).get('desired_roles', [])
-            for role in desired_roles:
-                if role.lower() in job.title.lower():
+            title_lower = job.title.lower()
+            for role, role_lower in desired_roles:
+                if role_lower in title_lower:
                     score += 30
                     match_reasons.append(f"Title matches desired role: {role}")
             
             # Location match
-            preferred_locations = user_profile.get('preferences', {}).get('preferred_locations', [])
-            for loc in preferred_locations:
-                if loc.lower() in job.location.lower():
+            location_lower = job.location.lower()
+            for loc, loc_lower in preferred_locations:
+                if loc_lower in location_lower:
                     score += 20
                     match_reasons.append(f"Location match: {loc}")
             
             # Remote preference
-            if user_profile.get('preferences', {}).get('remote_preference') == 'Remote Only':
-                if job.remote:
-                    score += 25
-                    match_reasons.append("Remote position")
+            if remote_only and job.remote:
+                score += 25
+                match_reasons.append("Remote position")
             
             # Salary range match
-            min_salary = user_profile.get('preferences', {}).get('min_salary', 0)
-            max_salary = user_profile.get('preferences', {}).get('max_salary', 999999)
-            
             if job.salary_min and job.salary_max:
                 if job.salary_min >= min_salary and job.salary_max <= max_salary:
                     score += 20
@@ -437,25 +471,19 @@ class ModularJobAggregator:
                     match_reasons.append("Salary partially in range")
             
             # Skills match (check description for skills)
-            skills = []
-            for category in ['languages', 'frameworks', 'databases', 'tools']:
-                skills.extend(user_profile.get('skills', {}).get(category, []))
-            
             description_lower = (job.description or '').lower()
-            matched_skills = []
-            for skill in skills:
-                if skill.lower() in description_lower:
-                    matched_skills.append(skill)
+            if skill_automaton is not None:
+                hits = {i for _, indexes in skill_automaton.iter(description_lower) for i in indexes}
+                matched_skills = [skill for i, (skill, _) in enumerate(skills) if i in hits]
+            else:
+                matched_skills = [skill for skill, skill_lower in skills if skill_lower in description_lower]
             
             if matched_skills:
                 score += min(25, len(matched_skills) * 5)
                 match_reasons.append(f"Skills match: {', '.join(matched_skills[:3])}")
             
             # Source weight adjustment
-            for source in JobSource:
-                if source.display_name == job.source:
-                    score *= source.weight
-                    break
+            score *= source_weights.get(job.source, 1)
             
             # Cap score at 100
             job.score = min(100, score)
@@ -463,11 +491,25 @@ class ModularJobAggregator:
         
         return jobs
     
+    def _build_skill_automaton(self, skills: List[tuple]):
+        """Aho-Corasick automaton mapping each lowercased skill to its indexes in skills"""
+        indexes: Dict[str, List[int]] = {}
+        for i, (_, skill_lower) in enumerate(skills):
+            indexes.setdefault(skill_lower, []).append(i)
+        
+        automaton = ahocorasick.Automaton()
+        for skill_lower, skill_indexes in indexes.items():
+            automaton.add_word(skill_lower, skill_indexes)
+        automaton.make_automaton()
+        return automaton
+    
     def get_best_jobs(self, query: str, location: str = "", 
-                     user_profile: Dict = None, limit: int = 20) -> Dict[str, Any]:
+                     user_profile: Dict = None, limit: int = 20,
+                     include_descriptions: bool = True) -> Dict[str, Any]:
         """
         Main method: Search all sources, score, and return best jobs
         Always returns the requested number of jobs (or all available if less)
+        Pass include_descriptions=False when the caller never reads descriptions
         """
         logger.info(f"\n{'='*60}")
         logger.info(f"🔍 Searching for: '{query}' in '{location or 'anywhere'}'")
@@ -489,23 +531,19 @@ class ModularJobAggregator:
                 'location': location
             }
         
-        # Score jobs if profile provided
+        # Score jobs if profile provided, then select the top jobs (up to limit)
+        # with a bounded heap rather than sorting every result
         if user_profile:
             all_jobs = self.score_jobs(all_jobs, user_profile)
-            # Sort by score (highest first)
-            all_jobs.sort(key=lambda x: x.score, reverse=True)
+            # Highest score first
+            top_jobs = heapq.nlargest(limit, all_jobs, key=operator.attrgetter('score'))
         else:
-            # Sort by posted date if available
-            all_jobs.sort(key=lambda x: x.posted_date or '', reverse=True)
+            # Most recently posted first, if available
+            top_jobs = heapq.nlargest(limit, all_jobs, key=lambda x: x.posted_date or '')
         
-        # Get top jobs (up to limit)
-        top_jobs = all_jobs[:limit]
-        
-        # Calculate statistics
-        sources_used = len(set(job.source for job in all_jobs))
-        source_breakdown = {}
-        for job in all_jobs:
-            source_breakdown[job.source] = source_breakdown.get(job.source, 0) + 1
+        # Calculate statistics in one counting pass; sources used is its key count
+        source_breakdown = dict(Counter(map(operator.attrgetter('source'), all_jobs)))
+        sources_used = len(source_breakdown)
         
         logger.info(f"\n📊 Results Summary:")
         logger.info(f"  Total jobs found: {len(all_jobs)}")
@@ -518,7 +556,7 @@ class ModularJobAggregator:
             logger.info(f"  Average score of top {len(top_jobs)}: {avg_score:.1f}/100")
         
         return {
-            'jobs': [job.to_dict() for job in top_jobs],
+            'jobs': [job.to_dict(include_descriptions) for job in top_jobs],
             'total_found': len(all_jobs),
             'sources_used': sources_used,
             'source_breakdown': source_breakdown,
@@ -531,13 +569,19 @@ class ModularJobAggregator:
     def save_results(self, results: Dict, filename: str = None) -> str:
         """Save results to JSON file"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            searched_at = results.get('timestamp')
+            now = datetime.fromisoformat(searched_at) if searched_at else datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"data/daily_searches/modular_search_{timestamp}.json"
         
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
         
         logger.info(f"💾 Results saved to: {filename}")
         return filename
@@ -570,7 +614,8 @@ if __name__ == "__main__":
         query="software engineer",
         location="San Francisco",
         user_profile=user_profile,
-        limit=20
+        limit=20,
+        include_descriptions=False  # Only title/company/score are displayed below
     )
     
     # Save results
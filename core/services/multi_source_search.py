@@ -11,6 +11,9 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from .optional_deps import HTTP2_AVAILABLE
+from .rate_limiter import adzuna_limiter
+
 class MultiSourceJobSearch:
     """Comprehensive job search across multiple platforms"""
     
@@ -36,6 +39,36 @@ class MultiSourceJobSearch:
         
         self.results_cache = {}
         
+        # Queries run concurrently; Adzuna requests go through the
+        # process-wide Adzuna token bucket
+        self.max_concurrent_queries = 5
+        
+        # Shared HTTP client (created lazily, reused across queries)
+        self.client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive client, creating it on first use"""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=30,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+            )
+        return self.client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
     async def search_all_sources(self, query: str, location: str = "", limit: int = 50) -> List[Dict]:
         """Search all enabled sources"""
         all_jobs = []
@@ -48,7 +81,6 @@ class MultiSourceJobSearch:
             adzuna_jobs = await self._search_adzuna(query, location, limit)
             all_jobs.extend(adzuna_jobs)
             print(f"  Adzuna: {len(adzuna_jobs)} jobs")
-            await asyncio.sleep(0.5)  # Rate limiting
         
         # Future: Add Indeed, LinkedIn when API keys available
         if self.apis['indeed']['enabled']:
@@ -91,44 +123,45 @@ class MultiSourceJobSearch:
             if location:
                 params['where'] = location
             
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            await adzuna_limiter.acquire()
+            response = await self._get_client().get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            jobs = []
+            now = datetime.now()
+            for item in data.get('results', []):
+                job = {
+                    'title': item.get('title', ''),
+                    'company': item.get('company', {}).get('display_name', ''),
+                    'location': item.get('location', {}).get('display_name', ''),
+                    'salary_min': item.get('salary_min'),
+                    'salary_max': item.get('salary_max'),
+                    'url': item.get('redirect_url', ''),
+                    'description': item.get('description', '')[:1000],
+                    'created': item.get('created'),
+                    'source': 'Adzuna',
+                    'category': item.get('category', {}).get('label', ''),
+                    'contract_type': item.get('contract_type', ''),
+                    'contract_time': item.get('contract_time', '')
+                }
                 
-                jobs = []
-                for item in data.get('results', []):
-                    job = {
-                        'title': item.get('title', ''),
-                        'company': item.get('company', {}).get('display_name', ''),
-                        'location': item.get('location', {}).get('display_name', ''),
-                        'salary_min': item.get('salary_min'),
-                        'salary_max': item.get('salary_max'),
-                        'url': item.get('redirect_url', ''),
-                        'description': item.get('description', '')[:1000],
-                        'created': item.get('created'),
-                        'source': 'Adzuna',
-                        'category': item.get('category', {}).get('label', ''),
-                        'contract_type': item.get('contract_type', ''),
-                        'contract_time': item.get('contract_time', '')
-                    }
-                    
-                    # Calculate days old
-                    if job['created']:
-                        try:
-                            created_date = datetime.fromisoformat(job['created'].replace('Z', '+00:00'))
-                            days_old = (datetime.now() - created_date.replace(tzinfo=None)).days
-                            job['days_old'] = days_old
-                        except:
-                            job['days_old'] = None
-                    
-                    # Generate unique hash for deduplication
-                    job['job_hash'] = self._generate_job_hash(job)
-                    
-                    if job['title'] and job['company']:
-                        jobs.append(job)
+                # Calculate days old
+                if job['created']:
+                    try:
+                        created_date = datetime.fromisoformat(job['created'].replace('Z', '+00:00'))
+                        days_old = (now - created_date.replace(tzinfo=None)).days
+                        job['days_old'] = days_old
+                    except:
+                        job['days_old'] = None
                 
-                return jobs
+                # Generate unique hash for deduplication
+                job['job_hash'] = self._generate_job_hash(job)
+                
+                if job['title'] and job['company']:
+                    jobs.append(job)
+            
+            return jobs
                 
         except Exception as e:
             print(f"    Adzuna error: {e}")
@@ -170,18 +203,15 @@ class MultiSourceJobSearch:
         print("\n[COMPREHENSIVE SEARCH] Starting multi-source job discovery")
         print("=" * 60)
         
-        all_jobs = []
         total_queries = len(queries)
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
         
-        for i, query in enumerate(queries, 1):
-            print(f"\n[{i}/{total_queries}] Query: {query}")
-            
-            jobs = await self.search_all_sources(query, location, limit=20)
-            all_jobs.extend(jobs)
-            
-            # Rate limiting between queries
-            if i < total_queries:
-                await asyncio.sleep(1.0)
+        # Run queries concurrently; Adzuna rate limiting is shared across them
+        results = await asyncio.gather(*[
+            self._bounded_search(semaphore, i, total_queries, query, location)
+            for i, query in enumerate(queries, 1)
+        ])
+        all_jobs = [job for jobs in results for job in jobs]
         
         # Final deduplication across all results
         unique_jobs = self._deduplicate_jobs(all_jobs)
@@ -192,6 +222,13 @@ class MultiSourceJobSearch:
         
         return unique_jobs
     
+    async def _bounded_search(self, semaphore: asyncio.Semaphore, i: int, total: int,
+                              query: str, location: str) -> List[Dict]:
+        """Search one query while holding a concurrency slot"""
+        async with semaphore:
+            print(f"\n[{i}/{total}] Query: {query}")
+            return await self.search_all_sources(query, location, limit=20)
+    
     def get_api_status(self) -> Dict:
         """Get status of all job search APIs"""
         status = {}
@@ -275,6 +312,7 @@ async def test_multi_source():
     ]
     
     jobs = await searcher.comprehensive_search(test_queries, location="San Francisco")
+    await searcher.aclose()
     
     if jobs:
         print(f"\n4. Sample Results:")
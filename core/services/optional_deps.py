@@ -0,0 +1,25 @@
+"""
+Optional speed-ups shared by the core services
+Each one is probed once here; callers fall back to the stdlib when it is missing
+"""
+
+import importlib.util
+
+# Optional: faster JSON decoding/encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional: HTTP/2 lets concurrent queries to one API share a connection (needs h2)
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+def parse_json(response):
+    """Decode a requests/httpx JSON response body, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
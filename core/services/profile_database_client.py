@@ -4,6 +4,7 @@ Fetches user profiles from Supabase database instead of profile.json
 """
 
 import os
+import copy
 import json
 from typing import Dict, Optional, Any
 from supabase import create_client, Client
@@ -262,11 +263,19 @@ class ProfileManager:
                 self.db_client = ProfileDatabaseClient()
             except Exception as e:
                 print(f"Database client initialization failed, using local profile: {e}")
+        
+        # Per-instance cache of database hits so repeated lookups skip the
+        # roundtrip; the local fallback is never cached
+        self._profile_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._profile_cache_size = 4
     
     def get_profile(self, user_id: str = None, email: str = None) -> Dict[str, Any]:
         """
         Get user profile from database or local file
         
+        Results are cached per (user_id, email); call reload_profile() to
+        pick up changes made since the first fetch.
+        
         Args:
             user_id: Optional user UUID
             email: Optional user email
@@ -274,19 +283,34 @@ class ProfileManager:
         Returns:
             User profile dictionary
         """
-        # Try database first if available
+        key = (user_id, email)
+        profile = self._profile_cache.get(key)
+        if profile is None:
+            profile = self._fetch_db_profile(user_id, email)
+            if profile is None:
+                # Fallback to local profile.json
+                return self._load_local_profile()
+            
+            self._profile_cache[key] = profile
+            if len(self._profile_cache) > self._profile_cache_size:
+                self._profile_cache.pop(next(iter(self._profile_cache)))
+        
+        # Callers get their own copy so mutations don't leak into the cache
+        return copy.deepcopy(profile)
+    
+    def reload_profile(self, user_id: str = None, email: str = None) -> Dict[str, Any]:
+        """Drop cached profiles and fetch this one fresh"""
+        self._profile_cache.clear()
+        return self.get_profile(user_id, email)
+    
+    def _fetch_db_profile(self, user_id: str = None, email: str = None) -> Optional[Dict[str, Any]]:
+        """Fetch profile from the database without caching; None if unavailable"""
         if self.db_client:
             if user_id:
-                profile = self.db_client.get_profile_by_user_id(user_id)
-                if profile:
-                    return profile
+                return self.db_client.get_profile_by_user_id(user_id) or None
             elif email:
-                profile = self.db_client.get_profile_by_email(email)
-                if profile:
-                    return profile
-        
-        # Fallback to local profile.json
-        return self._load_local_profile()
+                return self.db_client.get_profile_by_email(email) or None
+        return None
     
     def _load_local_profile(self) -> Dict[str, Any]:
         """Load profile from local profile.json file"""
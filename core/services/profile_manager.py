@@ -3,11 +3,67 @@ Profile Manager - Centralized profile data management
 Ensures zero fake data by managing all user information from profile.json
 """
 
+import copy
 import json
+import math
 import os
+import re
+import functools
 from typing import Dict, List, Optional
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Placeholder text that must never appear in a real profile
+FAKE_DATA_PATTERNS = (
+    'your.email@example.com',
+    'test@example.com',
+    'Your Full Name',
+    'Company Name',
+    'University Name',
+    'Project Name',
+    'Add your',
+    'lorem ipsum',
+    'placeholder',
+    'sample',
+    'example.com',
+    'john doe',
+    'jane doe'
+)
+
+# One alternation, longest first, so a single scan finds any pattern. It runs
+# case-sensitively over the lowercased profile, as the per-pattern check did
+_FAKE_DATA_RE = re.compile(
+    '|'.join(re.escape(p) for p in sorted(FAKE_DATA_PATTERNS, key=len, reverse=True))
+)
+
+@functools.lru_cache(maxsize=4)
+def _read_profile(profile_path: str, mtime: float) -> Dict:
+    """Parse profile.json once per process (keyed on mtime so edits are picked up)"""
+    # Both parsers decode UTF-8 bytes themselves, skipping the text-layer decode
+    raw = Path(profile_path).read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+@functools.lru_cache(maxsize=4)
+def _find_fake_data(profile_path: str, mtime: float) -> Optional[str]:
+    """Scan a profile version for placeholder text once, rather than on every ProfileManager"""
+    match = _FAKE_DATA_RE.search(json.dumps(_read_profile(profile_path, mtime), separators=(',', ':')).lower())
+    return match.group(0) if match else None
+
+def _has_non_finite_float(obj) -> bool:
+    """True if a JSON-like structure holds NaN or +/-Infinity anywhere"""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in obj)
+    return False
+
 class ProfileManager:
     """Manages user profile data with zero fake data guarantee"""
     
@@ -19,9 +75,9 @@ class ProfileManager:
     def load_profile(self) -> Dict:
         """Load profile data from JSON file"""
         try:
-            with open(self.profile_path, 'r', encoding='utf-8') as f:
-                profile = json.load(f)
-                return profile
+            mtime = self._profile_mtime = os.path.getmtime(self.profile_path)
+            # Callers may mutate their copy (add_achievement, add_project)
+            return copy.deepcopy(_read_profile(self.profile_path, mtime))
         except FileNotFoundError:
             raise FileNotFoundError(f"Profile file not found: {self.profile_path}")
         except json.JSONDecodeError as e:
@@ -30,27 +86,10 @@ class ProfileManager:
     def _validate_profile(self) -> None:
         """Validate that profile contains no fake/placeholder data"""
         
-        fake_data_patterns = [
-            'your.email@example.com',
-            'test@example.com',
-            'Your Full Name',
-            'Company Name',
-            'University Name',
-            'Project Name',
-            'Add your',
-            'lorem ipsum',
-            'placeholder',
-            'sample',
-            'example.com',
-            'john doe',
-            'jane doe'
-        ]
-        
-        profile_str = json.dumps(self.profile_data).lower()
-        
-        for pattern in fake_data_patterns:
-            if pattern in profile_str:
-                raise ValueError(f"FAKE DATA DETECTED: '{pattern}' found in profile. All data must be real.")
+        # Runs right after load_profile, so the cached scan of that file version applies
+        fake = _find_fake_data(self.profile_path, self._profile_mtime)
+        if fake:
+            raise ValueError(f"FAKE DATA DETECTED: '{fake}' found in profile. All data must be real.")
         
         # Validate required fields exist
         required_fields = ['personal', 'strengths', 'technical_skills', 'experience', 'projects']
@@ -173,35 +212,32 @@ class ProfileManager:
     def get_experience_summary(self) -> str:
         """Get formatted experience summary for AI prompts"""
         
-        experience_text = ""
+        # Collect the lines and join once instead of rebuilding the string per line
+        parts = []
         
         for exp in self.get_experience():
-            experience_text += f"\n{exp['title']} - {exp['company']} ({exp['duration']})\n"
-            for achievement in exp['achievements']:
-                experience_text += f"• {achievement}\n"
+            parts.append(f"\n{exp['title']} - {exp['company']} ({exp['duration']})\n")
+            parts.extend(f"• {achievement}\n" for achievement in exp['achievements'])
         
-        return experience_text.strip()
+        return ''.join(parts).strip()
     
     def get_projects_summary(self) -> str:
         """Get formatted projects summary for AI prompts"""
         
-        projects_text = ""
+        parts = []
         
         for project in self.get_projects():
-            projects_text += f"\n{project['name']}:\n"
-            projects_text += f"• {project['description']}\n"
-            projects_text += f"• Technologies: {', '.join(project['technologies'])}\n"
-            for highlight in project['highlights']:
-                projects_text += f"• {highlight}\n"
+            parts.append(f"\n{project['name']}:\n")
+            parts.append(f"• {project['description']}\n")
+            parts.append(f"• Technologies: {', '.join(project['technologies'])}\n")
+            parts.extend(f"• {highlight}\n" for highlight in project['highlights'])
         
-        return projects_text.strip()
+        return ''.join(parts).strip()
     
     def get_strengths_summary(self) -> str:
         """Get formatted strengths for AI prompts"""
         
-        strengths_text = "UNIQUE STRENGTHS:\n"
-        for strength in self.get_strengths():
-            strengths_text += f"• {strength}\n"
+        strengths_text = "UNIQUE STRENGTHS:\n" + ''.join(f"• {strength}\n" for strength in self.get_strengths())
         
         return strengths_text.strip()
     
@@ -230,8 +266,10 @@ PROJECTS:{self.get_projects_summary()}
 
 ACHIEVEMENTS:"""
 
-        for achievement in self.get_achievements():
-            background += f"\n• {achievement['title']}: {achievement['details']} - {achievement['impact']}"
+        background += ''.join(
+            f"\n• {achievement['title']}: {achievement['details']} - {achievement['impact']}"
+            for achievement in self.get_achievements()
+        )
         
         return background
     
@@ -276,8 +314,36 @@ ACHIEVEMENTS:"""
     def save_profile(self) -> None:
         """Save current profile data back to file"""
         
-        with open(self.profile_path, 'w', encoding='utf-8') as f:
-            json.dump(self.profile_data, f, indent=2, ensure_ascii=False)
+        path = Path(self.profile_path)
+        
+        # orjson would write these as null and json as NaN (which orjson can't
+        # read back), so reject them rather than let the backend decide the data
+        if _has_non_finite_float(self.profile_data):
+            raise ValueError("Profile contains NaN or Infinity, which JSON cannot store")
+        
+        # 2-space, non-ASCII-preserving layout either way. The two encoders can
+        # still differ byte for byte (e.g. float formatting), which only costs
+        # an extra rewrite in the unchanged check below
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(
+                self.profile_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            content = json.dumps(self.profile_data, indent=2, ensure_ascii=False, allow_nan=False).encode('utf-8')
+        
+        # Skip the rewrite (and the mtime bump that invalidates the parse cache) if nothing changed
+        try:
+            if path.read_bytes() == content:
+                print(f"[OK] Profile unchanged, {self.profile_path} not rewritten")
+                return
+        except FileNotFoundError:
+            pass
+        
+        # Write a temp file and rename over the original so an interrupted save never truncates the profile
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
         
         print(f"[OK] Profile saved to {self.profile_path}")
     
@@ -0,0 +1,51 @@
+"""
+Rate limiting for external job APIs
+One shared token bucket per API, so every searcher in the process stays under its limit
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Async token bucket: bursts of up to `burst` requests, refilled at `rate` per second
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Lock for the running event loop (a new asyncio.run gets a new one)"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self):
+        """Take a token, waiting only once the burst allowance is spent"""
+
+        # Refill and reserve under the lock, then sleep without holding it; a
+        # negative balance means earlier callers already hold the upcoming tokens
+        async with self._get_lock():
+            now = time.monotonic()
+            if self._refilled_at is not None:
+                elapsed = now - self._refilled_at
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._refilled_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Adzuna allows ~5 requests per second per app id
+adzuna_limiter = TokenBucket(rate=5.0, burst=5)
@@ -9,7 +9,62 @@ from typing import List, Dict
 from datetime import datetime
 import re
 import time
-import hashlib
+import bisect
+import heapq
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: stream Adzuna results one job at a time instead of loading the payload
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# RED FLAGS - jobs mentioning any of these are skipped
+RED_FLAGS = (
+    '5+ years', '7+ years', '10+ years', '8+ years',
+    'senior', 'principal', 'staff', 'lead',
+    'manager', 'director', 'vp', 'head of',
+    'expert', 'architect', 'seasoned',
+    '5 years', '7 years', '10 years'
+)
+
+# Salary bands: +10 at $80k, +10 more at $100k (index with bisect_right)
+SALARY_CUTS = (80000, 100000)
+SALARY_BONUS = (0, 10, 20)
+
+# Freshness bands: <=3 days +15, <=7 +10, <=14 +5 (index with bisect_left)
+DAYS_CUTS = (3, 7, 14)
+DAYS_BONUS = (15, 10, 5, 0)
+
+# Single-word red flags can be excluded server-side by Adzuna (what_exclude)
+ADZUNA_EXCLUDE = ' '.join(flag for flag in RED_FLAGS if flag.isalpha())
+
+# Entry-level keywords ORed into one Adzuna query (what_or)
+ADZUNA_ENTRY_LEVEL = 'junior graduate grad entry associate 2025 2026'
+
+# GREEN FLAGS - (phrase, points) boosts for entry-level signals
+GREEN_FLAGS = (
+    ('new grad', 25),
+    ('entry level', 20),
+    ('entry-level', 20),
+    ('junior', 15),
+    ('associate', 15),
+    ('0-2 years', 20),
+    ('0-3 years', 15),
+    ('recent graduate', 20),
+    ('university', 10),
+    ('bootcamp', 10),
+    ('intern to full-time', 15),
+    ('no experience required', 20),
+    ('fresh graduate', 20),
+    ('2026', 30),  # Specific year match
+    ('2025', 25),
+    ('rotational', 15),
+    ('graduate program', 20),
+    ('early career', 15)
+)
 
 
 class SmartJobSearchEngine:
@@ -53,7 +108,13 @@ class SmartJobSearchEngine:
     def generate_smart_queries(self, profile: Dict) -> List[str]:
         """Generate 50+ intelligent search queries based on profile"""
 
-        queries = []
+        # Keyed by normalised text so case/spacing variants collapse as they're
+        # added; the dict keeps generation order and the first spelling
+        queries: Dict[str, str] = {}
+
+        def add(*new_queries: str):
+            for query in new_queries:
+                queries.setdefault(query.strip().lower(), query)
 
         # Base queries for new grads
         base_templates = [
@@ -75,24 +136,24 @@ class SmartJobSearchEngine:
         # Generate year-based queries
         for template in base_templates:
             for year in years:
-                queries.append(template.format(year=year))
+                add(template.format(year=year))
 
         # Add skill-specific queries
         if 'technical_skills' in profile:
             for language in profile['technical_skills'].get('languages', [])[:3]:
-                queries.extend([
+                add(
                     f"{language} developer entry level",
                     f"junior {language} engineer",
                     f"{language} new grad 2026",
                     f"entry level {language}"
-                ])
+                )
 
             for framework in profile['technical_skills'].get('frameworks', [])[:3]:
-                queries.extend([
+                add(
                     f"{framework} developer junior",
                     f"{framework} engineer entry level",
                     f"{framework} new grad"
-                ])
+                )
 
         # Add special interest queries (music, AI, sports for Renato)
         special_interests = {
@@ -102,15 +163,13 @@ class SmartJobSearchEngine:
         }
 
         for interest, interest_queries in special_interests.items():
-            queries.extend(interest_queries)
+            add(*interest_queries)
 
         # Location-specific queries
         for location in profile.get('preferences', {}).get('locations', []):
-            queries.append(f"software engineer {location} new grad")
-            queries.append(f"junior developer {location}")
+            add(f"software engineer {location} new grad", f"junior developer {location}")
 
-        # Remove duplicates and return
-        return list(set(queries))
+        return list(queries.values())
 
     def smart_filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """Filter out fake entry-level jobs and score remaining ones"""
@@ -126,65 +185,25 @@ class SmartJobSearchEngine:
 
             description = str(job.get('description', '')).lower()
             title = str(job.get('title', '')).lower()
+            # Newline separator so phrases never match across title/description
+            text = f"{title}\n{description}"
 
-            # RED FLAGS - Skip these jobs
-            red_flags = [
-                '5+ years', '7+ years', '10+ years', '8+ years',
-                'senior', 'principal', 'staff', 'lead',
-                'manager', 'director', 'vp', 'head of',
-                'expert', 'architect', 'seasoned',
-                '5 years', '7 years', '10 years'
-            ]
-
-            if any(flag in description or flag in title for flag in red_flags):
+            if any(flag in text for flag in RED_FLAGS):
                 continue  # Skip this job
 
-            # GREEN FLAGS - Boost score for these
-            green_flags = {
-                'new grad': 25,
-                'entry level': 20,
-                'entry-level': 20,
-                'junior': 15,
-                'associate': 15,
-                '0-2 years': 20,
-                '0-3 years': 15,
-                'recent graduate': 20,
-                'university': 10,
-                'bootcamp': 10,
-                'intern to full-time': 15,
-                'no experience required': 20,
-                'fresh graduate': 20,
-                '2026': 30,  # Specific year match
-                '2025': 25,
-                'rotational': 15,
-                'graduate program': 20,
-                'early career': 15
-            }
-
-            # Calculate relevance score
-            score = 50  # Base score
-            for flag, points in green_flags.items():
-                if flag in description or flag in title:
-                    score += points
+            # Calculate relevance score from the green flag table
+            score = 50 + sum(points for flag, points in GREEN_FLAGS if flag in text)
 
             # Check salary if available
             if job.get('salary_min'):
-                if job['salary_min'] >= 80000:
-                    score += 10
-                if job['salary_min'] >= 100000:
-                    score += 10
+                score += SALARY_BONUS[bisect.bisect_right(SALARY_CUTS, job['salary_min'])]
 
             # Freshness bonus
             if job.get('created'):
                 try:
                     created_date = datetime.fromisoformat(job['created'].replace('Z', '+00:00'))
                     days_old = (datetime.now() - created_date).days
-                    if days_old <= 3:
-                        score += 15
-                    elif days_old <= 7:
-                        score += 10
-                    elif days_old <= 14:
-                        score += 5
+                    score += DAYS_BONUS[bisect.bisect_left(DAYS_CUTS, days_old)]
                 except Exception:
                     pass
 
@@ -195,14 +214,15 @@ class SmartJobSearchEngine:
                 filtered_jobs.append(job)
 
         # Sort by relevance score
-        filtered_jobs.sort(key=lambda x: x['relevance_score'], reverse=True)
+        filtered_jobs.sort(key=operator.itemgetter('relevance_score'), reverse=True)
 
         return filtered_jobs
 
-    def _get_job_hash(self, job: Dict) -> str:
+    def _get_job_hash(self, job: Dict) -> int:
         """Create unique hash for job to avoid duplicates"""
-        unique_string = f"{job.get('company', '')}{job.get('title', '')}{job.get('location', '')}"
-        return hashlib.md5(unique_string.encode()).hexdigest()
+        # seen_jobs only lives in memory, so the built-in 64-bit tuple hash
+        # is enough - no md5 digest or hex string per job
+        return hash((job.get('company', ''), job.get('title', ''), job.get('location', '')))
 
     def search_remoteok(self, query: str = None) -> List[Dict]:
         """Search RemoteOK API (completely free, no auth)"""
@@ -308,47 +328,54 @@ class SmartJobSearchEngine:
 
         jobs = []
 
-        for feed_url in self.rss_feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-
-                for entry in feed.entries[:20]:  # Limit to 20 per feed
-                    job = {
-                        'title': entry.get('title', ''),
-                        'company': entry.get('author', 'Unknown'),
-                        'location': 'See listing',
-                        'description': entry.get('summary', '')[:500],
-                        'url': entry.get('link', ''),
-                        'created': entry.get('published', ''),
-                        'source': f'RSS: {feed_url.split("/")[2]}'
-                    }
-                    jobs.append(job)
+        # Feeds are independent network fetches, so fetch them in parallel;
+        # map() keeps the results in feed order
+        with ThreadPoolExecutor(max_workers=len(self.rss_feeds) or 1) as executor:
+            for feed_jobs in executor.map(self._parse_rss_feed, self.rss_feeds):
+                jobs.extend(feed_jobs)
 
-            except Exception as e:
-                print(f"RSS feed error for {feed_url}: {e}")
-                continue
+        return jobs
+
+    def _parse_rss_feed(self, feed_url: str) -> List[Dict]:
+        """Fetch a single RSS feed and convert its entries to jobs"""
+
+        jobs = []
+
+        try:
+            feed = feedparser.parse(feed_url)
+
+            for entry in feed.entries[:20]:  # Limit to 20 per feed
+                job = {
+                    'title': entry.get('title', ''),
+                    'company': entry.get('author', 'Unknown'),
+                    'location': 'See listing',
+                    'description': entry.get('summary', '')[:500],
+                    'url': entry.get('link', ''),
+                    'created': entry.get('published', ''),
+                    'source': f'RSS: {feed_url.split("/")[2]}'
+                }
+                jobs.append(job)
+
+        except Exception as e:
+            print(f"RSS feed error for {feed_url}: {e}")
 
         return jobs
 
     def search_all_sources(self, profile: Dict, max_results: int = 100) -> List[Dict]:
         """Search all available sources with smart filtering"""
 
-        print("Generating smart search queries...")
-        queries = self.generate_smart_queries(profile)
-        print(f"Generated {len(queries)} search variations")
-
         all_jobs = []
 
-        # Search Adzuna with multiple queries (if available)
+        # Search Adzuna once, ORing the entry-level keywords server-side
+        # instead of issuing one request per query variation
         if self.adzuna_app_id and self.adzuna_api_key:
             print("Searching Adzuna...")
-            for query in queries[:5]:  # Top 5 queries
-                try:
-                    adzuna_jobs = self._search_adzuna(query, profile.get('location', 'us'))
-                    all_jobs.extend(adzuna_jobs)
-                    time.sleep(0.5)  # Rate limit
-                except Exception as e:
-                    print(f"Adzuna error: {e}")
+            all_jobs.extend(self._search_adzuna(
+                self._adzuna_query(profile),
+                profile.get('location', 'us'),
+                what_or=ADZUNA_ENTRY_LEVEL,
+                results_per_page=50
+            ))
 
         # Search free sources
         print("Searching RemoteOK...")
@@ -369,8 +396,29 @@ class SmartJobSearchEngine:
         # Return top results
         return filtered_jobs[:max_results]
 
-    def _search_adzuna(self, query: str, location: str = 'us') -> List[Dict]:
-        """Search Adzuna API"""
+    def _adzuna_query(self, profile: Dict) -> str:
+        """
+        Main Adzuna query: a short role title from the profile, or '' to rely on what_or
+
+        Adzuna requires every word of `what`, so this stays a single title
+        rather than one of the long generated query variations.
+        """
+
+        preferences = profile.get('preferences', {})
+        desired_role = preferences.get('desired_role', '')
+        if isinstance(desired_role, str) and desired_role.strip():
+            return desired_role.split(',')[0].strip()
+
+        for key in ('desired_roles', 'target_roles'):
+            roles = preferences.get(key) or []
+            if roles:
+                return str(roles[0]).strip()
+
+        return ''
+
+    def _search_adzuna(self, query: str, location: str = 'us', what_or: str = None,
+                       results_per_page: int = 20) -> List[Dict]:
+        """Search Adzuna API (what_or: space-separated keywords, any of which may match)"""
 
         jobs = []
 
@@ -379,22 +427,38 @@ class SmartJobSearchEngine:
             params = {
                 'app_id': self.adzuna_app_id,
                 'app_key': self.adzuna_api_key,
-                'results_per_page': 20,
-                'what': query,
+                'results_per_page': results_per_page,
+                'what_exclude': ADZUNA_EXCLUDE,
                 'max_days_old': 30
             }
+            if query:
+                params['what'] = query
+            if what_or:
+                params['what_or'] = what_or
+
+            with requests.get(url, params=params, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    return jobs
+
+                if IJSON_AVAILABLE:
+                    response.raw.decode_content = True
+                    results = ijson.items(response.raw, 'results.item', use_float=True)
+                else:
+                    results = response.json().get('results', [])
+
+                seen_urls = set()
+                for job in results:
+                    job_url = job.get('redirect_url', '')
+                    if job_url in seen_urls:
+                        continue
+                    seen_urls.add(job_url)
 
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-
-                for job in data.get('results', []):
                     formatted_job = {
                         'title': job.get('title', ''),
                         'company': job.get('company', {}).get('display_name', ''),
                         'location': job.get('location', {}).get('display_name', ''),
                         'description': job.get('description', ''),
-                        'url': job.get('redirect_url', ''),
+                        'url': job_url,
                         'salary_min': job.get('salary_min'),
                         'salary_max': job.get('salary_max'),
                         'created': job.get('created'),
@@ -455,7 +519,7 @@ class SmartJobSearchEngine:
         
         # Get top 5 companies
         analytics['top_companies'] = dict(
-            sorted(analytics['top_companies'].items(), key=lambda x: x[1], reverse=True)[:5]
+            heapq.nlargest(5, analytics['top_companies'].items(), key=operator.itemgetter(1))
         )
         
         return analytics
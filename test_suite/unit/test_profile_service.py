@@ -0,0 +1,60 @@
+"""
+Unit tests for ProfileService.validate_profile_data
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add backend services to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend', 'services'))
+
+from profile_service import ProfileService
+
+
+def validate(data):
+    return asyncio.run(ProfileService('test-user').validate_profile_data(data))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('data', [
+    {'personal': {'portfolio': 'https://www.example.com/me'}},
+    {'projects': [{'description': 'Cut the sample size needed for A/B tests by 40%'}]},
+    {'projects': [{'description': 'Built an app where users add your favourite songs'}]},
+    {'personal': {'email': 'contest@example.community'}},
+    {'experience': [{'company': 'Placeholder Labs Inc'}]},
+    {'personal': {'name': 'Renato Dap'}, 'strengths': ['Distributed systems']},
+])
+def test_legitimate_text_passes(data):
+    result = validate(data)
+    assert result == {'is_valid': True, 'errors': []}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('data, placeholder', [
+    ({'personal': {'email': 'your.email@example.com'}}, 'your.email@example.com'),
+    ({'personal': {'email': 'test@example.com'}}, 'test@example.com'),
+    ({'personal': {'name': 'Your Full Name'}}, 'your full name'),
+    ({'projects': [{'description': 'Lorem ipsum dolor sit amet'}]}, 'lorem ipsum'),
+    ({'experience': [{'company': 'Company Name'}]}, 'company name'),
+    ({'personal': {'name': '  John Doe '}}, 'john doe'),
+    ({'personal': {'website': 'example.com'}}, 'example.com'),
+])
+def test_placeholder_text_is_rejected(data, placeholder):
+    result = validate(data)
+    assert not result['is_valid']
+    assert result['errors'] == [f"Placeholder text found: '{placeholder}'"]
+
+
+@pytest.mark.unit
+def test_each_placeholder_reported_once():
+    result = validate({
+        'personal': {'name': 'Jane Doe', 'email': 'test@example.com'},
+        'references': ['Jane Doe', 'jane doe'],
+    })
+    assert result['errors'] == [
+        "Placeholder text found: 'jane doe'",
+        "Placeholder text found: 'test@example.com'",
+    ]